@@ -140,23 +140,23 @@ def simulate_single_hand():
 
     return jsonify({
         'winner': winner.name,
-        'amountWon': amount_won,
+        'amountWon': amount_won / 100,
         'description': description,
         'wentToShowdown': went_to_showdown,
         'agent1': {
             'name': p1.name,
             'cards': [format_card(c) for c in p1.hole_cards] if p1.hole_cards else [],
             'stackBefore': starting_stack,
-            'stackAfter': p1.stack,
+            'stackAfter': p1.stack / 100,
         },
         'agent2': {
             'name': p2.name,
             'cards': [format_card(c) for c in p2.hole_cards] if p2.hole_cards else [],
             'stackBefore': starting_stack,
-            'stackAfter': p2.stack,
+            'stackAfter': p2.stack / 100,
         },
         'board': [format_card(c) for c in game.board],
-        'pot': amount_won,
+        'pot': amount_won / 100,
         'actionHistory': game.action_history,
     })
 
@@ -198,7 +198,8 @@ def start_session():
         small_blind=small_blind,
         big_blind=big_blind,
         verbose=False,
-        show_progress=False
+        show_progress=False,
+        save_history=True
     )
 
     # Format hand results
@@ -209,9 +210,9 @@ def start_session():
             'winner': hr.winner_name,
             'amountWon': hr.amount_won,
             'description': hr.win_description,
-            'agent1Cards': hr.player1_cards,
-            'agent2Cards': hr.player2_cards,
-            'board': hr.board,
+            'agent1Cards': hr.player1_cards_str.split(),
+            'agent2Cards': hr.player2_cards_str.split(),
+            'board': hr.board_str.split(),
             'agent1StackBefore': hr.player1_stack_before,
             'agent1StackAfter': hr.player1_stack_after,
             'agent2StackBefore': hr.player2_stack_before,
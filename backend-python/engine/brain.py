@@ -9,9 +9,10 @@ from card import Card, Rank, Suit
 from hand_eval import rank_hand
 from strength import (
     calculate_preflop_strength as _calculate_preflop_strength,
-    is_premium_hand as _is_premium_hand,
-    is_strong_hand as _is_strong_hand,
-    is_medium_hand as _is_medium_hand,
+    classify_strength as _classify_strength,
+    PREMIUM,
+    STRONG,
+    MEDIUM,
     evaluate_postflop_hand as _evaluate_postflop_hand,
     classify_pair_strength as _classify_pair_strength,
     is_top_pair as _is_top_pair,
@@ -24,9 +25,7 @@ import random
 # They are imported above with underscore prefix to maintain internal API compatibility
 # The following functions are now in strength.py:
 # - calculate_preflop_strength() -> _calculate_preflop_strength()
-# - is_premium_hand() -> _is_premium_hand()
-# - is_strong_hand() -> _is_strong_hand()
-# - is_medium_hand() -> _is_medium_hand()
+# - classify_strength() -> _classify_strength()
 # - evaluate_postflop_hand() -> _evaluate_postflop_hand()
 # - classify_pair_strength() -> _classify_pair_strength()
 # - is_top_pair() -> _is_top_pair()
@@ -66,6 +65,7 @@ def make_preflop_decision(
         - bet_size: Amount to bet
     """
     hand_strength = _calculate_preflop_strength(hand)
+    strength_category = _classify_strength(hand_strength)
 
     # Check if hand qualifies for 4-bet range (only AA/KK/QQ/JJ/AK/A5s)
     card1, card2 = hand
@@ -89,20 +89,20 @@ def make_preflop_decision(
         # Facing a large raise relative to stack
         if facing_4bet or (raise_amount >= current_stack):
             # Facing all-in
-            if _is_premium_hand(hand_strength):
+            if strength_category == PREMIUM:
                 return ("call", raise_amount)
             else:
                 return ("fold", 0.0)
         else:
             # Large raise but not all-in - go all-in or fold
-            if _is_premium_hand(hand_strength) or _is_strong_hand(hand_strength):
+            if strength_category >= STRONG:
                 return ("raise", current_stack)  # All-in
             else:
                 return ("fold", 0.0)
 
     # Facing 4-bet (all-in)
     if facing_4bet:
-        if _is_premium_hand(hand_strength):
+        if strength_category == PREMIUM:
             return ("call", raise_amount if raise_amount else current_stack)
         else:
             return ("fold", 0.0)
@@ -112,7 +112,7 @@ def make_preflop_decision(
         if is_4bet_hand:
             # 4-bet all-in
             return ("raise", current_stack)
-        elif _is_strong_hand(hand_strength):
+        elif strength_category == STRONG:
             # Call with strong hands
             return ("call", raise_amount if raise_amount else 3.0 * big_blind)
         else:
@@ -120,10 +120,10 @@ def make_preflop_decision(
 
     # Facing first raise
     if facing_raise and not facing_3bet:
-        if _is_premium_hand(hand_strength):
+        if strength_category == PREMIUM:
             # 3-bet to 3x the raise
             return ("raise", (raise_amount if raise_amount else 3.0 * big_blind) * 3.0)
-        elif _is_strong_hand(hand_strength) or _is_medium_hand(hand_strength):
+        elif strength_category == STRONG or strength_category == MEDIUM:
             # Call with strong and medium hands
             return ("call", raise_amount if raise_amount else 3.0 * big_blind)
         else:
@@ -3,7 +3,7 @@ Card class for Texas Hold'em poker game representation.
 """
 
 from enum import Enum
-from typing import Union
+from typing import Dict, Tuple, Union
 
 
 class Suit(Enum):
@@ -78,6 +78,14 @@ class Rank(Enum):
         raise ValueError(f"Invalid rank value: {value}. Must be between 2 and 14.")
 
 
+# Cactus Kev card encoding: one prime per rank (deuce first) and one bit per suit
+CK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+CK_SUIT_BITS = {Suit.SPADES: 0x1, Suit.HEARTS: 0x2, Suit.DIAMONDS: 0x4, Suit.CLUBS: 0x8}
+
+# Suit number (0-3) used by Card.index, in the same order as Card.__lt__
+SUIT_INDEX = {Suit.SPADES: 0, Suit.HEARTS: 1, Suit.DIAMONDS: 2, Suit.CLUBS: 3}
+
+
 class Card:
     """
     Represents a single playing card for Texas Hold'em.
@@ -97,6 +105,8 @@ class Card:
         13
     """
     
+    __slots__ = ('_rank', '_suit', '_rank_value', '_index', '_ck32')
+    
     def __init__(self, rank: Union[Rank, str], suit: Union[Suit, str]):
         """
         Initialize a Card with rank and suit.
@@ -124,6 +134,13 @@ class Card:
             self._suit = suit
         else:
             raise TypeError(f"Suit must be Suit enum or string, got {type(suit)}")
+        
+        # Cards never change, so the rank value and packed encoding are built once here
+        self._rank_value = self._rank.numeric_value
+        rank_index = self._rank_value - 2
+        self._index = SUIT_INDEX[self._suit] * 13 + rank_index
+        self._ck32 = ((1 << (16 + rank_index)) | (CK_SUIT_BITS[self._suit] << 12)
+                      | (rank_index << 8) | CK_PRIMES[rank_index])
     
     @staticmethod
     def _parse_suit_string(suit_str: str) -> Suit:
@@ -161,6 +178,10 @@ class Card:
             >>> Card.from_string('Kh')
             Card(Rank.KING, Suit.HEARTS)
         """
+        card = _CARD_CACHE.get(card_str)
+        if card is not None and cls is Card:
+            return card
+        
         card_str = card_str.strip()
         if len(card_str) < 2:
             raise ValueError(f"Card string too short: {card_str}")
@@ -179,6 +200,20 @@ class Card:
         
         return cls(rank_str, suit_str)
     
+    @classmethod
+    def from_index(cls, index: int) -> 'Card':
+        """
+        Get the card at a deck index (0-51, see Card.index).
+        
+        Returns a shared instance, like from_string does for standard spellings.
+        
+        Raises:
+            ValueError: If index is outside 0-51
+        """
+        if not 0 <= index < 52:
+            raise ValueError(f"Card index must be 0-51, got {index}")
+        return CARDS_BY_INDEX[index]
+    
     def get_rank_value(self) -> int:
         """
         Get the numeric value of the card's rank.
@@ -186,7 +221,7 @@ class Card:
         Returns:
             Integer value: 2-10 for number cards, 11=J, 12=Q, 13=K, 14=A
         """
-        return self._rank.numeric_value
+        return self._rank_value
     
     @property
     def rank(self) -> Rank:
@@ -198,6 +233,25 @@ class Card:
         """Get the suit enum."""
         return self._suit
     
+    @property
+    def index(self) -> int:
+        """
+        Get the card's position in a 52-card deck (0-51): suit * 13 + rank,
+        with spades first and deuce = 0. `1 << card.index` is its bit in a
+        52-bit card set.
+        """
+        return self._index
+    
+    @property
+    def ck32(self) -> int:
+        """
+        Get the card as a Cactus Kev 32-bit integer.
+        
+        Layout: bits 16-28 rank bit (deuce = bit 16), bits 12-15 suit bit,
+        bits 8-11 rank index (deuce = 0), bits 0-7 rank prime.
+        """
+        return self._ck32
+    
     def __str__(self) -> str:
         """String representation: e.g., 'A♠', 'K♥', '2♦'"""
         return f"{self._rank}{self._suit}"
@@ -214,7 +268,7 @@ class Card:
     
     def __hash__(self) -> int:
         """Hash based on rank and suit for use in sets and dicts."""
-        return hash((self._rank, self._suit))
+        return self._ck32  # Unique per rank and suit, and already computed
     
     def __lt__(self, other) -> bool:
         """
@@ -244,6 +298,23 @@ class Card:
         return self == other or self > other
 
 
+# Cards are immutable, so from_string hands out one shared instance per
+# standard spelling ('As', 'kh', '10d', 'Tc', ...) instead of re-parsing
+_CARD_CACHE: Dict[str, Card] = {
+    rank_str + suit_str: Card(rank_str, suit_str)
+    for rank_str in ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'T', 't',
+                     'J', 'j', 'Q', 'q', 'K', 'k', 'A', 'a')
+    for suit_str in 'SHDCshdc'
+}
+
+# The same shared cards in deck index order (see Card.index)
+CARDS_BY_INDEX: Tuple[Card, ...] = tuple(
+    _CARD_CACHE[rank_str + suit_str]
+    for suit_str in 'SHDC'
+    for rank_str in ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+)
+
+
 def create_hand(card1: Union[Card, str], card2: Union[Card, str]) -> tuple[Card, Card]:
     """
     Create a 2-card Texas Hold'em hand.
@@ -67,6 +67,9 @@ class Player:
     Represents a poker player in a heads-up game.
     """
 
+    __slots__ = ('name', 'stack', 'position', 'hole_cards', 'current_bet',
+                 'total_invested', 'is_active', 'is_all_in')
+
     def __init__(self, name: str, stack: float, position: int):
         """
         Initialize a player.
@@ -100,12 +103,14 @@ class Player:
         Args:
             amount: Blind amount to post
         """
-        actual_bet = min(amount, self.stack)
-        self.stack -= actual_bet
+        stack = self.stack
+        actual_bet = amount if amount < stack else stack
+        stack -= actual_bet
+        self.stack = stack
         self.current_bet = actual_bet
         self.total_invested += actual_bet
 
-        if self.stack == 0:
+        if stack == 0:
             self.is_all_in = True
 
     def bet(self, amount: float) -> float:
@@ -118,17 +123,21 @@ class Player:
         Returns:
             Actual amount bet (may be less if all-in)
         """
-        additional = amount - self.current_bet
-        actual_additional = min(additional, self.stack)
+        stack = self.stack
+        current_bet = self.current_bet
+        additional = amount - current_bet
+        actual_additional = additional if additional < stack else stack
 
-        self.stack -= actual_additional
-        self.current_bet += actual_additional
+        stack -= actual_additional
+        current_bet += actual_additional
+        self.stack = stack
+        self.current_bet = current_bet
         self.total_invested += actual_additional
 
-        if self.stack == 0:
+        if stack == 0:
             self.is_all_in = True
 
-        return self.current_bet
+        return current_bet
 
     def fold(self):
         """Fold hand."""
@@ -285,6 +294,10 @@ class PokerGame:
         action_count = 0
         last_raiser = None
 
+        # Heads-up only (enforced by post_blinds), so the per-action checks
+        # below are unrolled over the two players instead of looping
+        p0, p1 = self.players
+
         while True:
             # Get current player
             current_player = action_order[action_count % len(action_order)]
@@ -298,8 +311,9 @@ class PokerGame:
                 continue
 
             # Check if betting is complete
-            all_matched = all(p.current_bet == self.current_bet or not p.is_active or p.is_all_in
-                            for p in self.players)
+            current_bet = self.current_bet
+            all_matched = ((p0.current_bet == current_bet or not p0.is_active or p0.is_all_in) and
+                           (p1.current_bet == current_bet or not p1.is_active or p1.is_all_in))
 
             # If all bets matched and everyone has acted at least once, round is complete
             if all_matched and action_count >= len(action_order):
@@ -307,11 +321,8 @@ class PokerGame:
                 if last_raiser is None or action_count >= len(action_order) + action_order.index(last_raiser):
                     break
 
-            # Count active non-all-in players
-            active_players = [p for p in self.players if p.is_active and not p.is_all_in]
-
             # If everyone is all-in or folded (no one can act), stop
-            if len(active_players) == 0:
+            if not ((p0.is_active and not p0.is_all_in) or (p1.is_active and not p1.is_all_in)):
                 break
 
             # Player must act
@@ -429,11 +440,8 @@ class PokerGame:
             if action_count > 100:
                 raise RuntimeError("Betting round exceeded maximum actions")
 
-        # Collect bets into pot
-        for player in self.players:
-            # Bets already added to pot during actions above
-            player.current_bet = 0.0
-
+        # Bets were added to the pot as they were made; per-street bets are
+        # zeroed when the next betting round starts.
         return True
 
     def showdown(self) -> Tuple[Player, str]:
@@ -15,12 +15,123 @@ Hand rankings:
     High Card = 1
 """
 
-from collections import Counter
-from typing import List, Tuple
-from card import Card, Rank, Suit
+from functools import lru_cache, reduce
+from itertools import combinations, combinations_with_replacement, islice
+from operator import itemgetter, or_
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from card import CK_PRIMES, CK_SUIT_BITS, Card, Rank, Suit, CARDS_BY_INDEX
+
+
+# Memoize whole rank_hand calls on the exact cards given. Worth turning on for
+# Monte Carlo loops that rank the same hands over and over; one-shot callers
+# gain nothing from it, so it is off by default.
+CACHE_RANK_HAND = False
+
+# Hand lookup table: compact hand key -> (score, tiebreakers), mostly 7-card
+# hands but 5- and 6-card hands use it too. The key packs a 13-nibble
+# rank-count word (4 bits per rank, 2 in the low nibble) with the 13-bit rank
+# mask of the flush suit (if any) above bit 52. Those two values fully
+# determine the best 5-card hand, so every hand with the same rank/flush
+# structure shares one entry. Entries are filled on first use (see also
+# warm_seven_card_table).
+_SEVEN_CARD_TABLE: Dict[int, Tuple[int, Tuple[int, ...]]] = {}
+
+# 5-card combination index tables, filled per hand size by _combo_getters
+_COMBO_GETTERS: Dict[int, List[Tuple[Tuple[int, ...], Callable]]] = {}
+
+# Number of tiebreakers each hand score carries (index = score)
+_TIEBREAKER_COUNTS = (0, 5, 4, 3, 3, 1, 5, 2, 2, 1, 5)
+
+# Packed score of a royal flush (see _pack_score): the highest possible value
+_ROYAL_FLUSH_PACKED = (10 << 20) | 0xEDCBA
+
+# Cactus Kev code of every card, by deck index (see Card.index)
+_CK_BY_INDEX = tuple(card.ck32 for card in CARDS_BY_INDEX)
+
+# Suit for each Cactus Kev suit bit (see Card.ck32)
+_SUIT_BY_CK_BIT = {bit: suit for suit, bit in CK_SUIT_BITS.items()}
+
+# Every straight as (13-bit rank mask, high card), best first; bit 0 is a
+# deuce and the wheel (A-2-3-4-5, high card 5) is just the last entry
+_STRAIGHTS = (
+    (0x1F00, 14), (0x0F80, 13), (0x07C0, 12), (0x03E0, 11), (0x01F0, 10),
+    (0x00F8, 9), (0x007C, 8), (0x003E, 7), (0x001F, 6), (0x100F, 5),
+)
+
+# Rank values making up each straight, keyed by its high card
+_STRAIGHT_RANKS = {
+    high: tuple(i + 2 for i in range(13) if straight_mask >> i & 1)
+    for straight_mask, high in _STRAIGHTS
+}
+
+
+def _build_straight_table() -> bytearray:
+    """High card of the best straight for every 13-bit rank mask (0 = none)."""
+    table = bytearray(1 << 13)
+    for straight_mask, high in reversed(_STRAIGHTS):
+        # Every superset of this straight's mask holds it; better straights
+        # are written later and overwrite worse ones
+        rest = ~straight_mask & 0x1FFF
+        subset = rest
+        while True:
+            table[straight_mask | subset] = high
+            if not subset:
+                break
+            subset = (subset - 1) & rest
+    return table
+
+
+# Straight lookup indexed by rank mask
+_STRAIGHT_HIGH = _build_straight_table()
+
+# Number of ranks present in each 13-bit rank mask (a popcount table; int.bit_count
+# needs Python 3.10)
+RANK_MASK_BITS = bytes(bin(mask).count('1') for mask in range(1 << 13))
+
+# One count nibble per suit, indexed by Cactus Kev suit bit: summing these
+# over a hand gives its four suit counts in one int (spades lowest)
+_SUIT_NIBBLE = (0, 0x1, 0x10, 0, 0x100, 0, 0, 0, 0x1000)
+
+
+class RankMeta(NamedTuple):
+    """
+    Extra facts about a ranked hand, returned by rank_hand.
+    
+    A field is None when it does not apply (no hole cards, board too short,
+    not trips). The mapping-style helpers treat None fields as missing, so
+    callers can keep using metadata.get('board_chop', False),
+    'trips_type' in metadata and metadata['trips_type'].
+    """
+    board_chop: Optional[bool] = None
+    hole_cards_play: Optional[bool] = None
+    trips_type: Optional[str] = None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Field value, or default if the field is unset or unknown."""
+        value = getattr(self, key, None) if key in self._fields else None
+        return default if value is None else value
+    
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            value = self.get(key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        return tuple.__getitem__(self, key)
+    
+    def to_dict(self) -> dict:
+        """Plain dict of the fields that are set."""
+        return {field: value for field, value in zip(self._fields, self) if value is not None}
+
 
+# Metadata of every hand ranked without hole cards
+_NO_META = RankMeta()
 
-def rank_hand(cards: List[Card], hole_cards: List[Card] = None) -> Tuple[int, List[int], dict]:
+
+def rank_hand(cards: List[Card], hole_cards: List[Card] = None) -> Tuple[int, List[int], RankMeta]:
     """
     Rank a poker hand and return numeric score with tiebreakers.
     
@@ -32,7 +143,8 @@ def rank_hand(cards: List[Card], hole_cards: List[Card] = None) -> Tuple[int, Li
         Tuple of (hand_rank_score, tiebreakers, metadata) where:
         - hand_rank_score: Integer from 1-10 representing hand strength
         - tiebreakers: List of integers used to break ties between same hand types
-        - metadata: Dictionary with additional info (e.g., 'trips_type': 'set' or 'trips')
+        - metadata: RankMeta with additional info (e.g., trips_type 'set' or 'trips');
+          supports dict-style .get(), `in` and [] lookups of its set fields
     
     Hand Rankings:
         10 = Royal Flush
@@ -50,382 +162,643 @@ def rank_hand(cards: List[Card], hole_cards: List[Card] = None) -> Tuple[int, Li
         >>> cards = [Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'), 
         ...          Card.from_string('Js'), Card.from_string('10s')]
         >>> rank_hand(cards)
-        (10, [14, 13, 12, 11, 10], {})
+        (10, [14, 13, 12, 11, 10], RankMeta(board_chop=None, hole_cards_play=None, trips_type=None))
         
         >>> cards = [Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
         ...          Card.from_string('4h'), Card.from_string('5h')]
         >>> rank_hand(cards)
-        (9, [5], {})
+        (9, [5], RankMeta(board_chop=None, hole_cards_play=None, trips_type=None))
+    """
+    if CACHE_RANK_HAND:
+        # Card order does not change the result, so sorted cards share an entry
+        hole_key = None if hole_cards is None else tuple(sorted(hole_cards, key=lambda c: c.index))
+        score, tiebreakers, metadata = _rank_hand_cached(tuple(sorted(cards, key=lambda c: c.index)),
+                                                         hole_key)
+        return (score, list(tiebreakers), metadata)
+    return _rank_hand(cards, hole_cards)
+
+
+@lru_cache(maxsize=1 << 20)
+def _rank_hand_cached(cards: Tuple[Card, ...],
+                      hole_cards: Optional[Tuple[Card, ...]]) -> Tuple[int, Tuple[int, ...], RankMeta]:
+    """
+    rank_hand behind an LRU cache (see CACHE_RANK_HAND).
+    """
+    score, tiebreakers, metadata = _rank_hand(cards, hole_cards)
+    return (score, tuple(tiebreakers), metadata)
+
+
+def rank_hand_indices(cards_bytes: bytes, hole_bytes: bytes = b'') -> Tuple[int, List[int], RankMeta]:
+    """
+    Rank a hand given as deck indices (see Card.index) instead of Card objects.
+    
+    Same rules and result as rank_hand, for callers that already keep their
+    cards as small ints, e.g. a bytes or bytearray deck.
+    
+    Args:
+        cards_bytes: Card indices 0-51 (bytes, bytearray or any sequence of ints)
+        hole_bytes: Indices of the 2 hole cards, or empty for no hole cards
+    
+    Returns:
+        Tuple of (hand_rank_score, tiebreakers, metadata), as for rank_hand
+    
+    Examples:
+        >>> rank_hand_indices(bytes([12, 11, 10, 9, 8]))
+        (10, [14, 13, 12, 11, 10], RankMeta(board_chop=None, hole_cards_play=None, trips_type=None))
     """
-    if not cards:
+    if any(i > 51 or i < 0 for i in cards_bytes) or any(i > 51 or i < 0 for i in hole_bytes):
+        raise ValueError("Card indices must be 0-51")
+    return _rank_indices(cards_bytes, hole_bytes if hole_bytes else None)
+
+
+def _rank_hand(cards: List[Card], hole_cards: Optional[List[Card]]) -> Tuple[int, List[int], RankMeta]:
+    """Uncached body of rank_hand: encodes the cards and ranks their indices."""
+    hole_indices = None if hole_cards is None else [c.index for c in hole_cards]
+    return _rank_indices([c.index for c in cards], hole_indices)
+
+
+def _rank_indices(indices: Sequence[int],
+                  hole_indices: Optional[Sequence[int]]) -> Tuple[int, List[int], RankMeta]:
+    """Shared body of rank_hand and rank_hand_indices, on card indices."""
+    if not indices:
         raise ValueError("Cannot rank empty hand")
     
-    if len(cards) < 5:
-        raise ValueError(f"Need at least 5 cards to rank a hand, got {len(cards)}")
+    if len(indices) < 5:
+        raise ValueError(f"Need at least 5 cards to rank a hand, got {len(indices)}")
     
-    # Check for duplicate cards
-    card_set = set(cards)
-    if len(card_set) != len(cards):
+    # Everything below works on ints
+    codes = [_CK_BY_INDEX[i] for i in indices]
+    bits = [1 << i for i in indices]
+    
+    # Check for duplicate cards: distinct bits OR together to their sum, a
+    # repeated bit does not
+    cards_mask = reduce(or_, bits)
+    if cards_mask != sum(bits):
         duplicates = []
-        seen = set()
-        for card in cards:
-            if card in seen:
-                duplicates.append(str(card))
-            seen.add(card)
+        seen = 0
+        for i, bit in zip(indices, bits):
+            if seen & bit:
+                duplicates.append(str(Card.from_index(i)))
+            seen |= bit
         raise ValueError(f"Duplicate cards detected: {', '.join(duplicates)}. Each card can only appear once.")
     
-    # Validate hole_cards if provided
-    metadata = {}
-    board_cards = None
-    if hole_cards is not None:
-        if len(hole_cards) != 2:
-            raise ValueError(f"hole_cards must contain exactly 2 cards, got {len(hole_cards)}")
+    # Validate hole cards if provided
+    if hole_indices is not None:
+        if len(hole_indices) != 2:
+            raise ValueError(f"hole_cards must contain exactly 2 cards, got {len(hole_indices)}")
         # Check that hole cards are in the cards list
-        hole_set = set(hole_cards)
-        cards_set = set(cards)
-        if not hole_set.issubset(cards_set):
+        hole_mask = (1 << hole_indices[0]) | (1 << hole_indices[1])
+        if hole_mask & ~cards_mask:
             raise ValueError("hole_cards must be a subset of cards")
-        # Get board cards (all cards minus hole cards)
-        board_cards = [c for c in cards if c not in hole_set]
-    
-    # Get best 5-card hand from the available cards
-    best_hand = _get_best_five_card_hand(cards)
-    
-    # Check if board chops (best hand uses only board cards, no hole cards)
-    if hole_cards is not None and board_cards is not None and len(board_cards) >= 5:
-        board_set = set(board_cards)
-        best_hand_set = set(best_hand)
-        if best_hand_set.issubset(board_set):
-            metadata['board_chop'] = True
-            metadata['hole_cards_play'] = False
-        else:
-            metadata['board_chop'] = False
-            metadata['hole_cards_play'] = True
-    
-    # Check for each hand type in descending order of strength
-    if _is_royal_flush(best_hand):
-        return (10, [14, 13, 12, 11, 10], metadata)
-    
-    straight_flush_result = _is_straight_flush(best_hand)
-    if straight_flush_result:
-        return (9, [straight_flush_result], metadata)
-    
-    quads_result = _is_quads(best_hand)
-    if quads_result:
-        return (8, quads_result, metadata)
-    
-    boat_result = _is_boat(best_hand)
-    if boat_result:
-        return (7, boat_result, metadata)
-    
-    flush_result = _is_flush(best_hand)
-    if flush_result:
-        return (6, flush_result, metadata)
-    
-    straight_result = _is_straight(best_hand)
-    if straight_result:
-        return (5, [straight_result], metadata)
-    
-    trips_result = _is_trips(best_hand)
-    if trips_result:
-        # Determine if it's a set or trips if hole_cards provided
-        if hole_cards is not None:
-            trips_type = _determine_trips_type(best_hand, hole_cards, cards)
-            metadata['trips_type'] = trips_type
-        return (4, trips_result, metadata)
-    
-    two_pair_result = _is_two_pair(best_hand)
-    if two_pair_result:
-        return (3, two_pair_result, metadata)
-    
-    one_pair_result = _is_one_pair(best_hand)
-    if one_pair_result:
-        return (2, one_pair_result, metadata)
-    
-    # High card
-    high_card_result = _get_high_card(best_hand)
-    return (1, high_card_result, metadata)
-
-
-def _get_best_five_card_hand(cards: List[Card]) -> List[Card]:
-    """
-    Get the best 5-card hand from a list of cards (for Texas Hold'em with 7 cards).
-    Uses brute force to check all combinations.
-    """
-    if len(cards) == 5:
-        return sorted(cards, key=lambda c: c.get_rank_value(), reverse=True)
     
-    # For more than 5 cards, find the best 5-card combination
-    from itertools import combinations
+    score, tiebreakers = _score_codes(codes)
+    if hole_indices is None:
+        return (score, tiebreakers, _NO_META)
     
-    best_hand = None
-    best_score = (0, [])
+    # Board chop: the board alone (all cards minus hole cards) already makes
+    # a hand worth as much as the best one, so the hole cards do not play
+    board_chop = None
+    if len(indices) >= 7:
+        board_codes = [ck for ck, bit in zip(codes, bits) if not hole_mask & bit]
+        board_chop = _score_codes(board_codes) == (score, tiebreakers)
     
-    for combo in combinations(cards, 5):
-        combo_list = list(combo)
-        score = _evaluate_five_cards(combo_list)
-        if score > best_score:
-            best_score = score
-            best_hand = combo_list
+    # Set: a pocket pair of the trips rank (plus one board card); anything
+    # else, e.g. a board pair plus one hole card, is trips
+    trips_type = None
+    if score == 4:
+        trips_rank = tiebreakers[0]
+        hole_rank0 = hole_indices[0] % 13 + 2
+        hole_rank1 = hole_indices[1] % 13 + 2
+        trips_type = 'set' if hole_rank0 == trips_rank and hole_rank1 == trips_rank else 'trips'
     
-    return sorted(best_hand, key=lambda c: c.get_rank_value(), reverse=True)
+    hole_cards_play = None if board_chop is None else not board_chop
+    return (score, tiebreakers, RankMeta(board_chop, hole_cards_play, trips_type))
 
 
-def _evaluate_five_cards(cards: List[Card]) -> Tuple[int, List[int]]:
-    """Helper to evaluate exactly 5 cards and return comparable tuple."""
-    if _is_royal_flush(cards):
-        return (10, [14, 13, 12, 11, 10])
+def _cache_clear() -> None:
+    """Drop every memoized hand score (exposed as rank_hand.cache_clear)."""
+    _SEVEN_CARD_TABLE.clear()
+    _rank_hand_cached.cache_clear()
+
+
+rank_hand.cache_clear = _cache_clear
+
+
+def _score_codes(codes: List[int]) -> Tuple[int, List[int]]:
+    """(score, tiebreakers) of 5 or more card codes (see Card.ck32)."""
+    if len(codes) <= 7:
+        score, tiebreakers, _ = _lookup_hand(codes)
+        return (score, tiebreakers)
+    return _unpack_score(_best_five_card_combo(codes)[0])
+
+
+def _lookup_hand(codes: List[int]) -> Tuple[int, List[int], Optional[Suit]]:
+    """
+    Score a 5 to 7 card hand, given as card codes (see Card.ck32), through the lookup table.
     
-    straight_flush_result = _is_straight_flush(cards)
-    if straight_flush_result:
-        return (9, [straight_flush_result])
+    Returns:
+        Tuple of (score, tiebreakers, flush_suit) where flush_suit is the suit
+        holding 5+ cards, or None if no flush is possible.
+    """
+    score, tiebreakers, flush_suit_bit = _rank_codes(codes)
+    return (score, list(tiebreakers), _SUIT_BY_CK_BIT.get(flush_suit_bit))
+
+
+def _rank5(c0: int, c1: int, c2: int, c3: int, c4: int) -> Tuple[int, Tuple[int, ...], int]:
+    """
+    Table lookup for exactly 5 card codes: _hand_key unrolled.
     
-    quads_result = _is_quads(cards)
-    if quads_result:
-        return (8, quads_result)
+    Five cards are a flush only if all share a suit, which one AND of the
+    codes tells.
     
-    boat_result = _is_boat(cards)
-    if boat_result:
-        return (7, boat_result)
+    Returns:
+        Tuple of (score, tiebreakers, flush_suit_bit), flush_suit_bit as in _hand_key
+    """
+    key = ((1 << ((c0 >> 6) & 0x3C)) + (1 << ((c1 >> 6) & 0x3C)) + (1 << ((c2 >> 6) & 0x3C))
+           + (1 << ((c3 >> 6) & 0x3C)) + (1 << ((c4 >> 6) & 0x3C)))
+    flush_suit_bit = (c0 & c1 & c2 & c3 & c4) >> 12 & 0xF
+    if flush_suit_bit:
+        key |= ((c0 | c1 | c2 | c3 | c4) >> 16) << 52
     
-    flush_result = _is_flush(cards)
-    if flush_result:
-        return (6, flush_result)
+    entry = _table_entry(key)
+    return (entry[0], entry[1], flush_suit_bit)
+
+
+def _rank7(c0: int, c1: int, c2: int, c3: int, c4: int, c5: int, c6: int) -> Tuple[int, Tuple[int, ...], int]:
+    """
+    Table lookup for exactly 7 card codes: _hand_key unrolled.
     
-    straight_result = _is_straight(cards)
-    if straight_result:
-        return (5, [straight_result])
+    The suits are counted one nibble each in a single int; a nibble reaching
+    5 carries into its top bit when 3 is added. At most one suit can hold 5
+    of 7 cards, and only then is its rank mask gathered.
     
-    trips_result = _is_trips(cards)
-    if trips_result:
-        return (4, trips_result)
+    Returns:
+        Tuple of (score, tiebreakers, flush_suit_bit), flush_suit_bit as in _hand_key
+    """
+    key = ((1 << ((c0 >> 6) & 0x3C)) + (1 << ((c1 >> 6) & 0x3C)) + (1 << ((c2 >> 6) & 0x3C))
+           + (1 << ((c3 >> 6) & 0x3C)) + (1 << ((c4 >> 6) & 0x3C)) + (1 << ((c5 >> 6) & 0x3C))
+           + (1 << ((c6 >> 6) & 0x3C)))
+    suit_counts = (_SUIT_NIBBLE[c0 >> 12 & 0xF] + _SUIT_NIBBLE[c1 >> 12 & 0xF]
+                   + _SUIT_NIBBLE[c2 >> 12 & 0xF] + _SUIT_NIBBLE[c3 >> 12 & 0xF]
+                   + _SUIT_NIBBLE[c4 >> 12 & 0xF] + _SUIT_NIBBLE[c5 >> 12 & 0xF]
+                   + _SUIT_NIBBLE[c6 >> 12 & 0xF])
+    flush = (suit_counts + 0x3333) & 0x8888
+    flush_suit_bit = 0
+    if flush:
+        flush_suit_bit = 1 << ((flush.bit_length() >> 2) - 1)
+        flush_mask = 0
+        for ck in (c0, c1, c2, c3, c4, c5, c6):
+            if ck >> 12 & flush_suit_bit:
+                flush_mask |= ck >> 16
+        key |= flush_mask << 52
+    
+    entry = _table_entry(key)
+    return (entry[0], entry[1], flush_suit_bit)
+
+
+def _hand_key(codes: List[int]) -> Tuple[int, int]:
+    """
+    Build the lookup-table key (see _SEVEN_CARD_TABLE) for 5 to 7 card codes.
     
-    two_pair_result = _is_two_pair(cards)
-    if two_pair_result:
-        return (3, two_pair_result)
+    Returns:
+        Tuple of (key, flush_suit_bit) where flush_suit_bit is the Cactus Kev
+        suit bit holding 5+ cards, or 0 if no flush is possible.
+    """
+    rank_counts = 0
+    suit_masks = [0] * 9  # 13-bit rank mask per Cactus Kev suit bit (1, 2, 4, 8)
+    for ck in codes:
+        rank_counts += 1 << (4 * ((ck >> 8) & 0xF))
+        suit_masks[(ck >> 12) & 0xF] |= ck >> 16
     
-    one_pair_result = _is_one_pair(cards)
-    if one_pair_result:
-        return (2, one_pair_result)
+    # A suit is a flush once its rank mask holds 5+ bits (cards are distinct)
+    for suit_bit in (1, 2, 4, 8):
+        if RANK_MASK_BITS[suit_masks[suit_bit]] >= 5:
+            return (rank_counts | (suit_masks[suit_bit] << 52), suit_bit)
     
-    high_card_result = _get_high_card(cards)
-    return (1, high_card_result)
+    return (rank_counts, 0)
 
 
-def _is_royal_flush(cards: List[Card]) -> bool:
-    """Check if hand is a royal flush (A-K-Q-J-10 of same suit)."""
-    if len(cards) != 5:
-        return False
-    
-    if not _is_flush(cards):
-        return False
-    
-    ranks = sorted([c.get_rank_value() for c in cards])
-    return ranks == [10, 11, 12, 13, 14]
+def _table_entry(key: int) -> Tuple[int, Tuple[int, ...]]:
+    """(score, tiebreakers) for a lookup-table key, filling the entry on first use."""
+    entry = _SEVEN_CARD_TABLE.get(key)
+    if entry is None:
+        entry = _evaluate_hand_key(key)
+        _SEVEN_CARD_TABLE[key] = entry
+    return entry
 
 
-def _is_straight_flush(cards: List[Card]) -> int:
+def _rank_codes(codes: Sequence[int]) -> Tuple[int, Tuple[int, ...], int]:
     """
-    Check if hand is a straight flush.
-    Returns the high card value if true, 0 otherwise.
-    Handles ace-low straight flush (wheel: A-2-3-4-5).
-    """
-    if len(cards) != 5:
-        return 0
+    Rank 5 to 7 card codes through the lookup table, dispatching to the
+    unrolled _rank7 and _rank5 where the hand size allows.
     
-    if not _is_flush(cards):
-        return 0
+    Returns:
+        Tuple of (score, tiebreakers, flush_suit_bit), flush_suit_bit as in _hand_key
     
-    straight_high = _is_straight(cards)
-    return straight_high
-
-
-def _is_quads(cards: List[Card]) -> List[int]:
+    Raises:
+        ValueError: If the hand has fewer than 5 or more than 7 cards
     """
-    Check if hand is quads (four of a kind).
-    Returns [quads_rank, kicker] if true, empty list otherwise.
+    if len(codes) == 7:
+        return _rank7(*codes)
+    if len(codes) == 5:
+        return _rank5(*codes)
+    if len(codes) != 6:
+        raise ValueError(f"Hands must have 5 to 7 cards, got {len(codes)}")
+    key, flush_suit_bit = _hand_key(codes)
+    entry = _table_entry(key)
+    return (entry[0], entry[1], flush_suit_bit)
+
+
+def rank_hands_batch(hands: Iterable[Sequence[int]]) -> Tuple[List[int], List[List[int]]]:
     """
-    if len(cards) != 5:
-        return []
+    Rank many 5 to 7 card hands in one call, for equity and simulation loops.
+    
+    Hands are given as Cactus Kev card codes (see Card.ck32) and go straight
+    through the lookup table: no Card objects, no duplicate checks and no
+    metadata. Scores and tiebreakers match rank_hand.
     
-    rank_counts = Counter(c.get_rank_value() for c in cards)
-    counts = rank_counts.most_common()
+    Args:
+        hands: Iterable of hands, each a sequence of 5 to 7 distinct card codes
     
-    if len(counts) == 2 and counts[0][1] == 4:
-        quads = counts[0][0]
-        kicker = counts[1][0]
-        return [quads, kicker]
+    Returns:
+        Tuple of (scores, tiebreakers), parallel lists with one entry per hand
     
-    return []
+    Raises:
+        ValueError: If a hand has fewer than 5 or more than 7 cards
+    """
+    scores = []
+    tiebreakers = []
+    for codes in hands:
+        entry = _rank_codes(codes)
+        scores.append(entry[0])
+        tiebreakers.append(list(entry[1]))
+    return (scores, tiebreakers)
 
 
-def _is_boat(cards: List[Card]) -> List[int]:
+def rank_hands_batch_packed(hands: Iterable[Sequence[int]]) -> List[int]:
     """
-    Check if hand is a boat (full house).
-    Returns [trips_rank, pair_rank] if true, empty list otherwise.
+    rank_hands_batch with each result packed into one integer.
+
+    The integers order exactly like (score, tiebreakers), so hands compare
+    with a single int comparison; the score is `packed >> 20`. Layout as in
+    _pack_score: score from bit 20, then up to five 4-bit tiebreakers.
+
+    Args:
+        hands: Iterable of hands, each a sequence of 5 to 7 distinct card codes
+
+    Returns:
+        Packed scores, one per hand
+
+    Raises:
+        ValueError: If a hand has fewer than 5 or more than 7 cards
     """
-    if len(cards) != 5:
-        return []
-    
-    rank_counts = Counter(c.get_rank_value() for c in cards)
-    counts = rank_counts.most_common()
-    
-    if len(counts) == 2 and counts[0][1] == 3 and counts[1][1] == 2:
-        trips = counts[0][0]
-        pair = counts[1][0]
-        return [trips, pair]
-    
-    return []
+    packed = []
+    for codes in hands:
+        entry = _rank_codes(codes)
+        packed.append(_pack_score(entry[0], entry[1]))
+    return packed
 
 
-def _is_flush(cards: List[Card]) -> List[int]:
+def pack_card_indices(indices: Sequence[int]) -> int:
     """
-    Check if hand is a flush.
-    Returns sorted list of ranks (high to low) if true, empty list otherwise.
+    Pack up to 7 deck indices (see Card.index) into one integer, 6 bits per
+    card with the first card lowest, as taken by rank_packed_hands.
     """
-    if len(cards) != 5:
-        return []
-    
-    suits = [c.suit for c in cards]
-    if len(set(suits)) != 1:
-        return []
-    
-    ranks = sorted([c.get_rank_value() for c in cards], reverse=True)
-    return ranks
+    word = 0
+    for shift, index in enumerate(indices):
+        word |= index << (6 * shift)
+    return word
+
+
+def rank_packed_hands(words: Iterable[int]) -> List[int]:
+    """
+    rank_hands_batch_packed for 7-card hands given as pack_card_indices words.
+
+    A whole hand is one small int, which is cheap to build, store and send to
+    worker processes in bulk equity runs; each card is decoded with a shift,
+    a mask and a table read. Indices are not validated.
 
+    Args:
+        words: Iterable of 7-card hands, each packed by pack_card_indices
 
-def _is_straight(cards: List[Card]) -> int:
+    Returns:
+        Packed scores, one per hand, as for rank_hands_batch_packed
     """
-    Check if hand is a straight.
-    Returns the high card value if true, 0 otherwise.
-    Handles ace-low straight (wheel: A-2-3-4-5, returns 5 as high).
+    ck = _CK_BY_INDEX
+    packed = []
+    for word in words:
+        score, tiebreakers, _ = _rank7(
+            ck[word & 63], ck[word >> 6 & 63], ck[word >> 12 & 63], ck[word >> 18 & 63],
+            ck[word >> 24 & 63], ck[word >> 30 & 63], ck[word >> 36 & 63])
+        packed.append(_pack_score(score, tiebreakers))
+    return packed
+
+
+def rank_hands_parallel(hands: Iterable[Sequence[int]], workers: Optional[int] = None,
+                        chunk_size: int = 50000) -> Tuple[List[int], List[List[int]]]:
     """
-    if len(cards) != 5:
-        return 0
+    rank_hands_batch spread over worker processes, for equity runs over
+    millions of hands.
+    
+    The evaluator is pure Python and holds the GIL, so threads would not run
+    it any faster; instead the hands are cut into chunks that separate
+    processes rank with rank_hands_batch. Inputs that fit in one chunk, or
+    workers=1, are ranked in this process.
+    
+    Args:
+        hands: Iterable of hands, each a sequence of 5 to 7 distinct card codes
+        workers: Number of worker processes (default: one per CPU)
+        chunk_size: Hands sent to a worker at a time
     
-    ranks = sorted([c.get_rank_value() for c in cards])
+    Returns:
+        Tuple of (scores, tiebreakers) in input order, as for rank_hands_batch
     
-    # Check for regular straight
-    if ranks == list(range(ranks[0], ranks[0] + 5)):
-        return ranks[-1]
+    Raises:
+        ValueError: If chunk_size is not positive, or as rank_hands_batch
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
     
-    # Check for ace-low straight (wheel: A-2-3-4-5)
-    if ranks == [2, 3, 4, 5, 14]:
-        return 5  # High card is 5 in ace-low straight
+    hands = list(hands)
+    if workers == 1 or len(hands) <= chunk_size:
+        return rank_hands_batch(hands)
     
-    return 0
+    # Imported here: the process pool machinery is the costliest part of
+    # importing this module, and only this path needs it
+    from concurrent.futures import ProcessPoolExecutor
 
+    chunks = [hands[i:i + chunk_size] for i in range(0, len(hands), chunk_size)]
+    scores = []
+    tiebreakers = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_scores, chunk_tiebreakers in pool.map(rank_hands_batch, chunks):
+            scores.extend(chunk_scores)
+            tiebreakers.extend(chunk_tiebreakers)
+    return (scores, tiebreakers)
 
-def _is_trips(cards: List[Card]) -> List[int]:
+
+def warm_seven_card_table() -> int:
+    """
+    Fill the 7-card lookup table for every hand that cannot make a flush.
+    
+    The table normally fills lazily, so long simulations pay an evaluation on
+    each new rank shape they meet. Calling this once up front (well under a
+    second) turns every later non-flush 7-card hand into a single
+    dict lookup. Flush shapes keep filling on first use.
+    
+    Returns:
+        Number of table entries added
     """
-    Check if hand is trips (three of a kind).
-    Returns [trips_rank, kicker1, kicker2] if true, empty list otherwise.
+    added = 0
+    for rank_indexes in combinations_with_replacement(range(13), 7):
+        key = 0
+        for rank_index in rank_indexes:
+            key += 1 << (4 * rank_index)
+        if key in _SEVEN_CARD_TABLE or any(rank_indexes.count(r) > 4 for r in set(rank_indexes)):
+            continue
+        _SEVEN_CARD_TABLE[key] = _evaluate_hand_key(key)
+        added += 1
+    return added
+
+
+def _evaluate_hand_key(key: int) -> Tuple[int, Tuple[int, ...]]:
     """
-    if len(cards) != 5:
-        return []
+    Score a hand straight from its lookup-table key (see _SEVEN_CARD_TABLE).
     
-    rank_counts = Counter(c.get_rank_value() for c in cards)
-    counts = rank_counts.most_common()
+    The rank counts and flush rank mask decide the winning category on their
+    own, so instead of trying all 21 five-card combinations this reads the
+    ranks by count (high to low) and picks the category and tiebreakers
+    directly. Matches the best combination _best_five_card_combo would find.
+    """
+    flush_mask = key >> 52
+    if flush_mask:
+        straight_flush_high = _STRAIGHT_HIGH[flush_mask]
+        if straight_flush_high == 14:
+            return (10, (14, 13, 12, 11, 10))
+        if straight_flush_high:
+            return (9, (straight_flush_high,))
+    
+    # Ranks present (high to low), and the same ranks grouped by count
+    present = []
+    by_count = ([], [], [], [], [])
+    rank_mask = 0
+    for i in range(12, -1, -1):
+        count = (key >> (4 * i)) & 0xF
+        if count:
+            present.append(i + 2)
+            by_count[count].append(i + 2)
+            rank_mask |= 1 << i
+    quads, trips, pairs = by_count[4], by_count[3], by_count[2]
+    
+    if quads:
+        kicker = next(r for r in present if r != quads[0])
+        return (8, (quads[0], kicker))
+    
+    if trips and (len(trips) > 1 or pairs):
+        pair = max(trips[1] if len(trips) > 1 else 0, pairs[0] if pairs else 0)
+        return (7, (trips[0], pair))
+    
+    if flush_mask:
+        return (6, tuple(islice((i + 2 for i in range(12, -1, -1) if flush_mask >> i & 1), 5)))
+    
+    straight_high = _STRAIGHT_HIGH[rank_mask]
+    if straight_high:
+        return (5, (straight_high,))
+    
+    if trips:
+        return (4, (trips[0],) + tuple(islice((r for r in present if r != trips[0]), 2)))
+    
+    if len(pairs) > 1:
+        kicker = next(r for r in present if r != pairs[0] and r != pairs[1])
+        return (3, (pairs[0], pairs[1], kicker))
+    
+    if pairs:
+        return (2, (pairs[0],) + tuple(islice((r for r in present if r != pairs[0]), 3)))
+    
+    return (1, tuple(present[:5]))
+
+
+def _select_best_hand(cards: List[Card], score: int, tiebreakers: List[int],
+                      flush_suit: Optional[Suit]) -> List[Card]:
+    """
+    Rebuild the best 5 cards from a known score and tiebreakers.
+    
+    Picks the earliest card of each required rank (restricted to the flush suit
+    for flush hands), which is the same combination the brute-force search in
+    _best_five_card_combo settles on. Returned high to low.
+    """
+    if score in (10, 9, 5):
+        high = 14 if score == 10 else tiebreakers[0]
+        needed = _STRAIGHT_RANKS[high]
+    elif score == 8:
+        needed = [tiebreakers[0]] * 4 + tiebreakers[1:]
+    elif score == 7:
+        needed = [tiebreakers[0]] * 3 + [tiebreakers[1]] * 2
+    elif score == 4:
+        needed = [tiebreakers[0]] * 3 + tiebreakers[1:]
+    elif score == 3:
+        needed = [tiebreakers[0]] * 2 + [tiebreakers[1]] * 2 + tiebreakers[2:]
+    elif score == 2:
+        needed = [tiebreakers[0]] * 2 + tiebreakers[1:]
+    else:
+        needed = list(tiebreakers)
     
-    if len(counts) == 3 and counts[0][1] == 3:
-        trips = counts[0][0]
-        kickers = sorted([counts[1][0], counts[2][0]], reverse=True)
-        return [trips] + kickers
+    suit = flush_suit if score in (10, 9, 6) else None
+    remaining = [0] * 15  # Cards still needed, indexed by rank value
+    for rank in needed:
+        remaining[rank] += 1
+    best_hand = []
+    for card in cards:
+        rank = card.get_rank_value()
+        if remaining[rank] and (suit is None or card.suit == suit):
+            remaining[rank] -= 1
+            best_hand.append(card)
     
-    return []
+    return sorted(best_hand, key=Card.get_rank_value, reverse=True)
 
 
-def _is_two_pair(cards: List[Card]) -> List[int]:
-    """
-    Check if hand is two pair.
-    Returns [high_pair, low_pair, kicker] if true, empty list otherwise.
+def _best_hand_and_score(cards: List[Card]) -> Tuple[List[Card], Tuple[int, List[int]]]:
     """
-    if len(cards) != 5:
-        return []
-    
-    rank_counts = Counter(c.get_rank_value() for c in cards)
-    counts = rank_counts.most_common()
+    Get the best 5-card hand (high to low) together with its (score, tiebreakers).
     
-    if len(counts) == 3 and counts[0][1] == 2 and counts[1][1] == 2:
-        pairs = sorted([counts[0][0], counts[1][0]], reverse=True)
-        kicker = counts[2][0]
-        return pairs + [kicker]
+    Hold'em sized hands (5 to 7 cards) go through the lookup table; larger
+    ones check every 5-card combination.
+    """
+    codes = [c.ck32 for c in cards]
+    if len(cards) <= 7:
+        score, tiebreakers, flush_suit = _lookup_hand(codes)
+        return (_select_best_hand(cards, score, tiebreakers, flush_suit), (score, tiebreakers))
     
-    return []
+    best_packed, best_combo = _best_five_card_combo(codes)
+    best_hand = sorted([cards[i] for i in best_combo], key=Card.get_rank_value, reverse=True)
+    return (best_hand, _unpack_score(best_packed))
 
 
-def _is_one_pair(cards: List[Card]) -> List[int]:
+def _best_five_card_combo(codes: List[int]) -> Tuple[int, Tuple[int, ...]]:
+    """
+    Brute-force search over every 5-card combination of the given card codes.
+    
+    Takes Cactus Kev card codes (see Card.ck32). Each combination is gathered
+    in one step by a precomputed itemgetter (see _combo_getters) and scored as
+    a packed integer by _evaluate_five_ck.
+    Returns (best_packed_score, best_combo_indices); see _pack_score.
+    Stops at the first royal flush, since no other combination can beat it.
     """
-    Check if hand is one pair.
-    Returns [pair_rank, kicker1, kicker2, kicker3] if true, empty list otherwise.
+    best_combo = None
+    best_packed = -1
+    
+    # Work out once which categories the whole hand can reach: with a pair
+    # somewhere and no possible flush or straight, no unpaired combination
+    # (a high card hand) can be the best one, so the kernel may skip them
+    all_ranks = 0
+    suit_masks = [0] * 9
+    for ck in codes:
+        all_ranks |= ck >> 16
+        suit_masks[(ck >> 12) & 0xF] |= ck >> 16
+    paired_only = (RANK_MASK_BITS[all_ranks] < len(codes)
+                   and max(RANK_MASK_BITS[mask] for mask in suit_masks) < 5
+                   and not _STRAIGHT_HIGH[all_ranks])
+    
+    for combo, gather in _combo_getters(len(codes)):
+        packed = _evaluate_five_ck(*gather(codes), paired_only)
+        if packed > best_packed:
+            if packed == _ROYAL_FLUSH_PACKED:
+                # Royal flush is the maximum score: nothing can beat it
+                return (packed, combo)
+            best_packed = packed
+            best_combo = combo
+    
+    return (best_packed, best_combo)
+
+
+def _evaluate_five_ck(c0: int, c1: int, c2: int, c3: int, c4: int,
+                      paired_only: bool = False) -> int:
     """
-    if len(cards) != 5:
-        return []
+    Score 5 Cactus Kev card codes (see Card.ck32) as a packed integer.
     
-    rank_counts = Counter(c.get_rank_value() for c in cards)
-    counts = rank_counts.most_common()
+    Built on Cactus Kev's lookup tables: flushes are found by ANDing the suit
+    bits and looked up by rank mask, other hands with five distinct ranks by
+    rank mask as well, and paired hands by the product of their rank primes. With paired_only set the
+    caller has ruled out flushes and straights, and high card hands are scored
+    0 unexamined.
+    """
+    if c0 & c1 & c2 & c3 & c4 & 0xF000:
+        return _FLUSH_LOOKUP[(c0 | c1 | c2 | c3 | c4) >> 16]
     
-    if len(counts) == 4 and counts[0][1] == 2:
-        pair = counts[0][0]
-        kickers = sorted([counts[1][0], counts[2][0], counts[3][0]], reverse=True)
-        return [pair] + kickers
+    packed = _UNPAIRED_LOOKUP[(c0 | c1 | c2 | c3 | c4) >> 16]
+    if packed:
+        return 0 if paired_only else packed
     
-    return []
+    return _PAIRED_LOOKUP[(c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF)]
 
 
-def _get_high_card(cards: List[Card]) -> List[int]:
+def _build_five_card_tables() -> Tuple[List[int], List[int], Dict[int, int]]:
+    """
+    Build the Cactus Kev style tables behind _evaluate_five_ck.
+    
+    Returns (flush, unpaired, paired): packed scores of flushes and of
+    non-flush hands with five distinct ranks, both indexed by 13-bit rank mask
+    (0 for masks without exactly five ranks), and of paired hands keyed by the
+    product of their rank primes. Every entry comes from _evaluate_hand_key.
     """
-    Get high card hand.
-    Returns sorted list of ranks (high to low).
+    flush = [0] * (1 << 13)
+    unpaired = [0] * (1 << 13)
+    paired = {}
+    for rank_indexes in combinations_with_replacement(range(13), 5):
+        key = 0
+        product = 1
+        for rank_index in rank_indexes:
+            key += 1 << (4 * rank_index)
+            product *= CK_PRIMES[rank_index]
+        if len(set(rank_indexes)) == 5:
+            rank_mask = 0
+            for rank_index in rank_indexes:
+                rank_mask |= 1 << rank_index
+            flush[rank_mask] = _pack_score(*_evaluate_hand_key(key | (rank_mask << 52)))
+            unpaired[rank_mask] = _pack_score(*_evaluate_hand_key(key))
+        elif max(rank_indexes.count(r) for r in rank_indexes) <= 4:
+            paired[product] = _pack_score(*_evaluate_hand_key(key))
+    return (flush, unpaired, paired)
+
+
+def _combo_getters(n: int) -> List[Tuple[Tuple[int, ...], Callable]]:
     """
-    ranks = sorted([c.get_rank_value() for c in cards], reverse=True)
-    return ranks
+    Get (indices, itemgetter) for every 5-card combination of n cards.
+    
+    Built once per hand size, in itertools.combinations order. Each getter
+    pulls a combination's 5 values out of a per-card list in a single C call.
+    """
+    getters = _COMBO_GETTERS.get(n)
+    if getters is None:
+        getters = [(combo, itemgetter(*combo)) for combo in combinations(range(n), 5)]
+        _COMBO_GETTERS[n] = getters
+    return getters
 
 
-def _determine_trips_type(best_hand: List[Card], hole_cards: List[Card], all_cards: List[Card]) -> str:
+def _pack_score(score: int, tiebreakers: List[int]) -> int:
     """
-    Determine if trips is a 'set' (pocket pair + board card) or 'trips' (board pair + hole card).
-    
-    Args:
-        best_hand: The best 5-card hand (should be trips)
-        hole_cards: The 2 hole cards
-        all_cards: All cards (hole + board)
+    Pack (score, tiebreakers) into one integer that orders like the tuple.
     
-    Returns:
-        'set' if pocket pair + board card, 'trips' if board pair + hole card
+    Layout: score in bits 20+, then up to five 4-bit tiebreakers from bit 16
+    down to bit 0 (unused slots stay zero). Hands of the same score always have
+    the same number of tiebreakers, so integer order matches tuple order.
     """
-    from collections import Counter
-    
-    # Get the trips rank
-    rank_counts = Counter(c.get_rank_value() for c in best_hand)
-    trips_rank = None
-    for rank, count in rank_counts.items():
-        if count == 3:
-            trips_rank = rank
-            break
-    
-    if trips_rank is None:
-        return 'trips'  # Fallback, shouldn't happen
-    
-    # Count how many of the trips rank are in hole cards
-    hole_ranks = [c.get_rank_value() for c in hole_cards]
-    trips_in_hole = hole_ranks.count(trips_rank)
-    
-    # Get board cards (all cards minus hole cards)
-    board_cards = [c for c in all_cards if c not in hole_cards]
-    board_ranks = [c.get_rank_value() for c in board_cards]
-    trips_on_board = board_ranks.count(trips_rank)
-    
-    # Set: pocket pair (2 in hole) + 1 on board = 3 total
-    # Trips: 2 on board + 1 in hole = 3 total
-    if trips_in_hole == 2:
-        return 'set'  # Pocket pair + board card
-    elif trips_in_hole == 1 and trips_on_board == 2:
-        return 'trips'  # Board pair + hole card
-    else:
-        # Edge case: could be 3 on board (board trips) or other combinations
-        # For simplicity, if not clearly a set, call it trips
-        return 'trips'
+    packed = score
+    for shift in range(5):
+        packed = (packed << 4) | (tiebreakers[shift] if shift < len(tiebreakers) else 0)
+    return packed
+
+
+def _unpack_score(packed: int) -> Tuple[int, List[int]]:
+    """Inverse of _pack_score."""
+    score = packed >> 20
+    count = _TIEBREAKER_COUNTS[score]
+    tiebreakers = [(packed >> (16 - 4 * i)) & 0xF for i in range(count)]
+    return (score, tiebreakers)
+
+
+# 5-card lookup tables (see _build_five_card_tables)
+_FLUSH_LOOKUP, _UNPAIRED_LOOKUP, _PAIRED_LOOKUP = _build_five_card_tables()
 
 
 def manual_test():
@@ -548,27 +921,17 @@ def manual_test():
             else:
                 hand_name = f"{hand_name} (Board Pair)"
         
+        # Best 5-card hand, shared by the board chop and best hand printouts
+        best_hand, _ = _best_hand_and_score(all_cards)
+        
         # Show board chop if applicable
         if metadata.get('board_chop', False):
             print(f"\n⚠️  BOARD CHOP - Hole cards don't play!")
             print(f"   The board itself contains the best 5-card hand.")
             print(f"   All players will split (chop) the pot equally.")
             
-            # Get the best hand from board
-            from itertools import combinations
-            best_hand = None
-            best_score = (0, [])
-            board_cards = [c for c in all_cards if c not in [hole1, hole2]]
-            
-            for combo in combinations(all_cards, 5):
-                combo_list = list(combo)
-                combo_score = _evaluate_five_cards(combo_list)
-                if combo_score > best_score:
-                    best_score = combo_score
-                    best_hand = combo_list
-            
             if best_hand:
-                print(f"\nBest 5-card hand (from board): {', '.join(str(c) for c in sorted(best_hand, key=lambda c: c.get_rank_value(), reverse=True))}")
+                print(f"\nBest 5-card hand (from board): {', '.join(str(c) for c in best_hand)}")
                 print(f"Hole cards: {hole1}, {hole2} (do not play)")
         
         print(f"\nHand Rank: {hand_name} (Score: {score})")
@@ -576,19 +939,8 @@ def manual_test():
         
         # Show best 5-card hand if more than 5 cards and not a board chop
         if len(all_cards) > 5 and not metadata.get('board_chop', False):
-            from itertools import combinations
-            best_hand = None
-            best_score = (0, [])
-            
-            for combo in combinations(all_cards, 5):
-                combo_list = list(combo)
-                combo_score = _evaluate_five_cards(combo_list)
-                if combo_score > best_score:
-                    best_score = combo_score
-                    best_hand = combo_list
-            
             if best_hand:
-                print(f"\nBest 5-card hand: {', '.join(str(c) for c in sorted(best_hand, key=lambda c: c.get_rank_value(), reverse=True))}")
+                print(f"\nBest 5-card hand: {', '.join(str(c) for c in best_hand)}")
         
         print("\n" + "=" * 60)
         
@@ -604,595 +956,4 @@ def manual_test():
 
 
 if __name__ == "__main__":
-    import unittest
-    
-    class TestHandRanking(unittest.TestCase):
-        """Unit tests for hand ranking function."""
-        
-        def test_royal_flush(self):
-            """Test royal flush detection."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'),
-                Card.from_string('Js'), Card.from_string('10s')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 10)
-            self.assertEqual(tiebreakers, [14, 13, 12, 11, 10])
-        
-        def test_straight_flush(self):
-            """Test straight flush detection."""
-            # Regular straight flush
-            cards = [
-                Card.from_string('9s'), Card.from_string('8s'), Card.from_string('7s'),
-                Card.from_string('6s'), Card.from_string('5s')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 9)
-            self.assertEqual(tiebreakers, [9])
-            
-            # Ace-low straight flush (wheel)
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
-                Card.from_string('4h'), Card.from_string('5h')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 9)
-            self.assertEqual(tiebreakers, [5])
-        
-        def test_quads(self):
-            """Test quads (four of a kind) detection."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
-                Card.from_string('Ac'), Card.from_string('Ks')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 8)
-            self.assertEqual(tiebreakers, [14, 13])
-        
-        def test_boat(self):
-            """Test boat (full house) detection."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
-                Card.from_string('Ks'), Card.from_string('Kh')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 7)
-            self.assertEqual(tiebreakers, [14, 13])
-        
-        def test_flush(self):
-            """Test flush detection."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'),
-                Card.from_string('9s'), Card.from_string('2s')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 6)
-            self.assertEqual(tiebreakers, [14, 13, 12, 9, 2])
-        
-        def test_straight(self):
-            """Test straight detection."""
-            # Regular straight
-            cards = [
-                Card.from_string('9s'), Card.from_string('8h'), Card.from_string('7d'),
-                Card.from_string('6c'), Card.from_string('5s')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 5)
-            self.assertEqual(tiebreakers, [9])
-            
-            # Ace-low straight (wheel)
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('5h')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 5)
-            self.assertEqual(tiebreakers, [5])
-            
-            # High straight (10-J-Q-K-A)
-            cards = [
-                Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qd'),
-                Card.from_string('Jc'), Card.from_string('10s')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 5)
-            self.assertEqual(tiebreakers, [14])
-        
-        def test_trips(self):
-            """Test trips (three of a kind) detection."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
-                Card.from_string('Ks'), Card.from_string('Qs')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 4)
-            self.assertEqual(tiebreakers, [14, 13, 12])
-        
-        def test_two_pair(self):
-            """Test two pair detection."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ks'),
-                Card.from_string('Kh'), Card.from_string('Qs')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 3)
-            self.assertEqual(tiebreakers, [14, 13, 12])
-        
-        def test_one_pair(self):
-            """Test one pair detection."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ks'),
-                Card.from_string('Qh'), Card.from_string('Js')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 2)
-            self.assertEqual(tiebreakers, [14, 13, 12, 11])
-        
-        def test_high_card(self):
-            """Test high card detection."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'),
-                Card.from_string('9h'), Card.from_string('2d')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 1)
-            self.assertEqual(tiebreakers, [14, 13, 12, 9, 2])
-        
-        def test_seven_card_hand(self):
-            """Test that function works with 7 cards (Texas Hold'em)."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'),
-                Card.from_string('Js'), Card.from_string('10s'),  # Royal flush
-                Card.from_string('9h'), Card.from_string('8h')    # Extra cards
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 10)
-            self.assertEqual(tiebreakers, [14, 13, 12, 11, 10])
-        
-        def test_edge_case_wheel_straight_flush(self):
-            """Test ace-low straight flush (wheel) edge case."""
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
-                Card.from_string('4h'), Card.from_string('5h')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 9)
-            self.assertEqual(tiebreakers, [5])
-        
-        def test_edge_case_wheel_straight(self):
-            """Test ace-low straight (wheel) edge case."""
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('5h')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 5)
-            self.assertEqual(tiebreakers, [5])
-        
-        def test_edge_case_not_straight_with_ace(self):
-            """Test that A-K-Q-J-9 is not a straight."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qd'),
-                Card.from_string('Jc'), Card.from_string('9s')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertNotEqual(score, 5)  # Should not be a straight
-        
-        def test_edge_case_boat_vs_trips(self):
-            """Test that boat is correctly identified vs trips."""
-            # Boat
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
-                Card.from_string('Ks'), Card.from_string('Kh')
-            ]
-            score, _, _ = rank_hand(cards)
-            self.assertEqual(score, 7)
-            
-            # Trips (not boat)
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
-                Card.from_string('Ks'), Card.from_string('Qs')
-            ]
-            score, _, _ = rank_hand(cards)
-            self.assertEqual(score, 4)
-        
-        def test_edge_case_flush_vs_straight_flush(self):
-            """Test that straight flush is correctly identified vs flush."""
-            # Straight flush
-            cards = [
-                Card.from_string('9s'), Card.from_string('8s'), Card.from_string('7s'),
-                Card.from_string('6s'), Card.from_string('5s')
-            ]
-            score, _, _ = rank_hand(cards)
-            self.assertEqual(score, 9)
-            
-            # Flush (not straight)
-            cards = [
-                Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'),
-                Card.from_string('9s'), Card.from_string('2s')
-            ]
-            score, _, _ = rank_hand(cards)
-            self.assertEqual(score, 6)
-        
-        def test_empty_hand_error(self):
-            """Test that empty hand raises error."""
-            with self.assertRaises(ValueError):
-                rank_hand([])
-        
-        def test_insufficient_cards_error(self):
-            """Test that less than 5 cards raises error."""
-            cards = [Card.from_string('As'), Card.from_string('Ks')]
-            with self.assertRaises(ValueError):
-                rank_hand(cards)
-        
-        def test_tiebreaker_ordering(self):
-            """Test that tiebreakers are correctly ordered."""
-            # Two pair: A-A-K-K-Q should have tiebreakers [14, 13, 12]
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ks'),
-                Card.from_string('Kh'), Card.from_string('Qs')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 3)
-            self.assertEqual(tiebreakers, [14, 13, 12])
-            
-            # Two pair: K-K-Q-Q-A should have tiebreakers [13, 12, 14]
-            cards = [
-                Card.from_string('Ks'), Card.from_string('Kh'), Card.from_string('Qs'),
-                Card.from_string('Qh'), Card.from_string('As')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 3)
-            self.assertEqual(tiebreakers, [13, 12, 14])
-        
-        def test_duplicate_cards_error(self):
-            """Test that duplicate cards raise an error."""
-            # Duplicate in hand
-            cards = [
-                Card.from_string('As'), Card.from_string('As'), Card.from_string('Ks'),
-                Card.from_string('Qs'), Card.from_string('Js')
-            ]
-            with self.assertRaises(ValueError) as context:
-                rank_hand(cards)
-            self.assertIn("Duplicate cards", str(context.exception))
-            
-            # Duplicate in 7-card hand
-            cards = [
-                Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qs'),
-                Card.from_string('Js'), Card.from_string('10s'), Card.from_string('9h'),
-                Card.from_string('As')  # Duplicate As
-            ]
-            with self.assertRaises(ValueError) as context:
-                rank_hand(cards)
-            self.assertIn("Duplicate cards", str(context.exception))
-        
-        def test_set_vs_trips(self):
-            """Test that set vs trips can be differentiated."""
-            # Set: Pocket pair (As, Ah) + board card (Ad) + 2 other board cards
-            hole_cards = [Card.from_string('As'), Card.from_string('Ah')]
-            board = [Card.from_string('Ad'), Card.from_string('Ks'), Card.from_string('Qs')]
-            all_cards = hole_cards + board
-            
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
-            self.assertEqual(score, 4)
-            self.assertEqual(metadata.get('trips_type'), 'set')
-            
-            # Trips: Board pair (As, Ah) + hole card (Ad) + 2 other cards
-            hole_cards = [Card.from_string('Ad'), Card.from_string('Ks')]
-            board = [Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Qs')]
-            all_cards = hole_cards + board
-            
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
-            self.assertEqual(score, 4)
-            self.assertEqual(metadata.get('trips_type'), 'trips')
-            
-            # Test without hole_cards parameter (should not have trips_type)
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
-                Card.from_string('Ks'), Card.from_string('Qs')
-            ]
-            score, tiebreakers, metadata = rank_hand(cards)
-            self.assertEqual(score, 4)
-            self.assertNotIn('trips_type', metadata)
-        
-        def test_board_chop_straight(self):
-            """Test board chop with straight on board."""
-            # Pocket Kings on board with straight 2-3-4-5-6
-            hole_cards = [Card.from_string('Ks'), Card.from_string('Kh')]
-            board = [
-                Card.from_string('2s'), Card.from_string('3h'), Card.from_string('4d'),
-                Card.from_string('5c'), Card.from_string('6s')
-            ]
-            all_cards = hole_cards + board
-            
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
-            self.assertEqual(score, 5)  # Straight
-            self.assertTrue(metadata.get('board_chop', False))
-            self.assertFalse(metadata.get('hole_cards_play', True))
-        
-        def test_board_chop_straight_flush(self):
-            """Test board chop with straight flush on board."""
-            # Any hole cards on board with straight flush
-            hole_cards = [Card.from_string('Ks'), Card.from_string('Kh')]
-            board = [
-                Card.from_string('2s'), Card.from_string('3s'), Card.from_string('4s'),
-                Card.from_string('5s'), Card.from_string('6s')
-            ]
-            all_cards = hole_cards + board
-            
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
-            self.assertEqual(score, 9)  # Straight Flush
-            self.assertTrue(metadata.get('board_chop', False))
-            self.assertFalse(metadata.get('hole_cards_play', True))
-        
-        def test_board_chop_flush(self):
-            """Test board chop with flush on board."""
-            hole_cards = [Card.from_string('Kh'), Card.from_string('Kd')]
-            board = [
-                Card.from_string('2s'), Card.from_string('4s'), Card.from_string('6s'),
-                Card.from_string('8s'), Card.from_string('10s')  # Flush, not a straight
-            ]
-            all_cards = hole_cards + board
-            
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
-            self.assertEqual(score, 6)  # Flush
-            self.assertTrue(metadata.get('board_chop', False))
-            self.assertFalse(metadata.get('hole_cards_play', True))
-        
-        def test_no_board_chop_when_hole_cards_play(self):
-            """Test that board chop is False when hole cards are used."""
-            # Pocket Aces with board that doesn't make best hand (no straight/flush)
-            hole_cards = [Card.from_string('As'), Card.from_string('Ah')]
-            board = [
-                Card.from_string('2h'), Card.from_string('3d'), Card.from_string('4c'),
-                Card.from_string('6s'), Card.from_string('8h')  # No straight possible, mixed suits
-            ]
-            all_cards = hole_cards + board
-            
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
-            self.assertEqual(score, 2)  # One Pair (Aces)
-            self.assertFalse(metadata.get('board_chop', True))
-            self.assertTrue(metadata.get('hole_cards_play', False))
-        
-        def test_board_chop_with_quads_on_board(self):
-            """Test board chop with quads on board where board kicker is highest."""
-            # Board has quads with high kicker, hole cards are lower
-            hole_cards = [Card.from_string('2s'), Card.from_string('3h')]
-            board = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
-                Card.from_string('Ac'), Card.from_string('Ks')  # K is higher than hole cards
-            ]
-            all_cards = hole_cards + board
-            
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
-            self.assertEqual(score, 8)  # Quads
-            self.assertTrue(metadata.get('board_chop', False))
-            self.assertFalse(metadata.get('hole_cards_play', True))
-        
-        def test_edge_case_wheel_straight_high_card(self):
-            """Test that wheel (A-2-3-4-5) returns 5 as high card, not Ace."""
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('5h')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 5)  # Straight
-            self.assertEqual(tiebreakers, [5])  # High card is 5, not 14 (Ace)
-        
-        def test_edge_case_wheel_straight_flush_high_card(self):
-            """Test that wheel straight flush returns 5 as high card."""
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
-                Card.from_string('4h'), Card.from_string('5h')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 9)  # Straight Flush
-            self.assertEqual(tiebreakers, [5])  # High card is 5
-        
-        def test_edge_case_wheel_vs_high_straight(self):
-            """Test that high straight (10-J-Q-K-A) beats wheel."""
-            wheel = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('5h')
-            ]
-            high_straight = [
-                Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qd'),
-                Card.from_string('Jc'), Card.from_string('10s')
-            ]
-            
-            wheel_score, wheel_tie, _ = rank_hand(wheel)
-            high_score, high_tie, _ = rank_hand(high_straight)
-            
-            self.assertEqual(wheel_score, 5)
-            self.assertEqual(high_score, 5)
-            self.assertEqual(wheel_tie, [5])
-            self.assertEqual(high_tie, [14])  # High straight wins with Ace high
-            # High straight should beat wheel
-            self.assertGreater(high_tie[0], wheel_tie[0])
-        
-        def test_edge_case_wheel_board_chop(self):
-            """Test board chop with wheel on board."""
-            hole_cards = [Card.from_string('Ks'), Card.from_string('Kh')]
-            board = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('5h')
-            ]
-            all_cards = hole_cards + board
-            
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
-            self.assertEqual(score, 5)  # Straight (wheel)
-            self.assertEqual(tiebreakers, [5])  # High card is 5
-            self.assertTrue(metadata.get('board_chop', False))
-            self.assertFalse(metadata.get('hole_cards_play', True))
-        
-        def test_edge_case_wheel_straight_flush_board_chop(self):
-            """Test board chop with wheel straight flush on board."""
-            hole_cards = [Card.from_string('Ks'), Card.from_string('Kh')]
-            board = [
-                Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
-                Card.from_string('4h'), Card.from_string('5h')
-            ]
-            all_cards = hole_cards + board
-            
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
-            self.assertEqual(score, 9)  # Straight Flush (wheel)
-            self.assertEqual(tiebreakers, [5])
-            self.assertTrue(metadata.get('board_chop', False))
-        
-        def test_edge_case_not_straight_ace_high(self):
-            """Test that A-K-Q-J-9 is not a straight (missing 10)."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qd'),
-                Card.from_string('Jc'), Card.from_string('9s')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertNotEqual(score, 5)  # Should not be a straight
-            self.assertEqual(score, 1)  # Should be high card
-        
-        def test_edge_case_not_straight_ace_low(self):
-            """Test that A-2-3-4-6 is not a straight (missing 5)."""
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('6h')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertNotEqual(score, 5)  # Should not be a straight
-            self.assertEqual(score, 1)  # Should be high card
-        
-        def test_edge_case_not_straight_middle_gap(self):
-            """Test that 2-3-4-6-7 is not a straight (missing 5)."""
-            cards = [
-                Card.from_string('2s'), Card.from_string('3h'), Card.from_string('4d'),
-                Card.from_string('6c'), Card.from_string('7s')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertNotEqual(score, 5)  # Should not be a straight
-            self.assertEqual(score, 1)  # Should be high card
-        
-        def test_edge_case_quads_with_wheel_kicker(self):
-            """Test quads with wheel kicker (edge case for tiebreakers)."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
-                Card.from_string('Ac'), Card.from_string('5h')  # Wheel high card as kicker
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 8)  # Quads
-            self.assertEqual(tiebreakers, [14, 5])  # Quads rank, kicker
-        
-        def test_edge_case_boat_with_wheel_trips(self):
-            """Test full house where trips are wheel (A-A-A-2-2)."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
-                Card.from_string('2s'), Card.from_string('2h')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 7)  # Boat
-            self.assertEqual(tiebreakers, [14, 2])  # Trips rank, pair rank
-        
-        def test_edge_case_boat_with_wheel_pair(self):
-            """Test full house where pair is wheel (A-A-2-2-2)."""
-            cards = [
-                Card.from_string('As'), Card.from_string('Ah'),
-                Card.from_string('2s'), Card.from_string('2h'), Card.from_string('2d')
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 7)  # Boat
-            self.assertEqual(tiebreakers, [2, 14])  # Trips rank (2), pair rank (A)
-        
-        def test_edge_case_wheel_in_seven_cards(self):
-            """Test that wheel is correctly identified in 7-card hand."""
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('5h'),  # Wheel
-                Card.from_string('Ks'), Card.from_string('Qh')  # Extra cards
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 5)  # Straight (wheel)
-            self.assertEqual(tiebreakers, [5])
-        
-        def test_edge_case_wheel_straight_flush_in_seven_cards(self):
-            """Test that wheel straight flush is correctly identified in 7-card hand."""
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
-                Card.from_string('4h'), Card.from_string('5h'),  # Wheel straight flush
-                Card.from_string('Ks'), Card.from_string('Qh')  # Extra cards
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertEqual(score, 9)  # Straight Flush (wheel)
-            self.assertEqual(tiebreakers, [5])
-        
-        def test_edge_case_high_straight_vs_wheel_in_seven_cards(self):
-            """Test that high straight beats wheel when both possible in 7 cards."""
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('5h'),  # Wheel possible
-                Card.from_string('Kh'), Card.from_string('Qh')   # High straight possible
-            ]
-            # Should choose high straight (10-J-Q-K-A) over wheel
-            score, tiebreakers, _ = rank_hand(cards)
-            # Actually, with these cards, we can't make high straight (need 10, J)
-            # So it should be wheel
-            self.assertEqual(score, 5)  # Straight
-            # But let's test with actual high straight possible
-            cards2 = [
-                Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qd'),
-                Card.from_string('Jc'), Card.from_string('10s'),  # High straight
-                Card.from_string('2h'), Card.from_string('3h')    # Extra cards
-            ]
-            score2, tiebreakers2, _ = rank_hand(cards2)
-            self.assertEqual(score2, 5)
-            self.assertEqual(tiebreakers2, [14])  # High straight
-        
-        def test_edge_case_wheel_with_pocket_pair(self):
-            """Test wheel with pocket pair (should still be wheel, not pair)."""
-            hole_cards = [Card.from_string('Ks'), Card.from_string('Kh')]
-            board = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('5h')
-            ]
-            all_cards = hole_cards + board
-            
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
-            self.assertEqual(score, 5)  # Straight (wheel), not pair
-            self.assertEqual(tiebreakers, [5])
-            self.assertTrue(metadata.get('board_chop', False))
-        
-        def test_edge_case_almost_wheel_missing_one(self):
-            """Test A-2-3-4-X where X is not 5 (not a wheel)."""
-            cards = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('6h')  # Missing 5
-            ]
-            score, tiebreakers, _ = rank_hand(cards)
-            self.assertNotEqual(score, 5)  # Should not be a straight
-            self.assertEqual(score, 1)  # High card
-        
-        def test_edge_case_wheel_vs_regular_straight_comparison(self):
-            """Test that regular straight (6-7-8-9-10) beats wheel."""
-            wheel = [
-                Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
-                Card.from_string('4c'), Card.from_string('5h')
-            ]
-            regular = [
-                Card.from_string('6s'), Card.from_string('7h'), Card.from_string('8d'),
-                Card.from_string('9c'), Card.from_string('10s')
-            ]
-            
-            wheel_score, wheel_tie, _ = rank_hand(wheel)
-            regular_score, regular_tie, _ = rank_hand(regular)
-            
-            self.assertEqual(wheel_score, 5)
-            self.assertEqual(regular_score, 5)
-            self.assertEqual(wheel_tie, [5])
-            self.assertEqual(regular_tie, [10])
-            # Regular straight should beat wheel
-            self.assertGreater(regular_tie[0], wheel_tie[0])
-    
-    import sys
-    
-    # Check if user wants manual testing
-    if len(sys.argv) > 1 and sys.argv[1] == 'manual':
-        manual_test()
-    else:
-        # Default: run unit tests
-        unittest.main()
+    manual_test()
@@ -13,17 +13,26 @@ Phase 1, Step 6 implementation.
 """
 
 import csv
+import multiprocessing
 import os
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import List, Dict, Tuple, Callable, Optional
-from card import Card, Rank, Suit
-from hand_eval import rank_hand
+from card import CARDS_BY_INDEX, Card
+from hand_eval import rank_hands_batch_packed
 import brain as main_brain
 import fish_brain
 
 
+# Showdown description of each rank_hand score
+HAND_NAMES = {
+    10: "Royal Flush", 9: "Straight Flush", 8: "Quads",
+    7: "Boat", 6: "Flush", 5: "Straight",
+    4: "Trips", 3: "Two Pair", 2: "One Pair", 1: "High Card"
+}
+
+
 @dataclass
 class AgentConfig:
     """Configuration for a poker agent."""
@@ -35,18 +44,23 @@ class AgentConfig:
 @dataclass
 class HandResult:
     """Result of a single hand."""
+    __slots__ = ('hand_number', 'winner_name', 'amount_won', 'win_description',
+                 'player1_cards_str', 'player2_cards_str', 'board_str',
+                 'player1_stack_before', 'player2_stack_before',
+                 'player1_stack_after', 'player2_stack_after', 'action_history')
+
     hand_number: int
     winner_name: str
     amount_won: float
     win_description: str
-    player1_cards: List[str]
-    player2_cards: List[str]
-    board: List[str]
+    player1_cards_str: str  # Space-separated, e.g. "A♠ K♥"
+    player2_cards_str: str
+    board_str: str
     player1_stack_before: float
     player2_stack_before: float
     player1_stack_after: float
     player2_stack_after: float
-    action_history: List[str]
+    action_history: List[str]  # () unless the run saved histories
 
 
 @dataclass
@@ -100,6 +114,8 @@ class SimulationResult:
     hand_results: List[HandResult] = field(default_factory=list)
     start_time: datetime = None
     end_time: datetime = None
+    history_saved: bool = True  # False when run without save_history
+    streamed_to: Optional[str] = None  # CSV the hands were written to instead of hand_results
 
     @property
     def duration_seconds(self) -> float:
@@ -109,67 +125,109 @@ class SimulationResult:
         return 0.0
 
 
+# Every card's deck index (see Card.index), spades first and deuce low
+_FULL_DECK = bytes(range(52))
+
+# str(card) for every deck index, so hand records need no Card.__str__ calls
+_CARD_STR = tuple(str(card) for card in CARDS_BY_INDEX)
+
+# Column names of a results CSV, one row per hand
+_CSV_HEADER = (
+    'hand_number', 'winner', 'amount_won', 'description',
+    'player1_cards', 'player2_cards', 'board',
+    'player1_stack_before', 'player2_stack_before',
+    'player1_stack_after', 'player2_stack_after'
+)
+
+
 class SimulationDeck:
     """
     Deck for simulation with optional seeding for reproducibility.
+
+    Cards are held as their deck indices (0-51) in a bytearray; cards[:pos]
+    are still in the deck. Indices only become Card objects when dealt, as
+    the shared instances from card.CARDS_BY_INDEX.
+
+    There is no separate shuffle: each deal runs the next Fisher-Yates step,
+    swapping a randomly chosen remaining card to the top and dealing it. A
+    hand uses at most a dozen cards, so this draws a dozen random numbers
+    instead of shuffling all 52 every hand, with the same uniform deal.
+
+    Each deck draws from its own random.Random, so the global random state
+    (used by the brains) neither affects nor is affected by the deal.
     """
 
     def __init__(self, seed: int = None):
         """Initialize deck with optional random seed."""
-        self.cards: List[Card] = []
+        self.cards = bytearray(_FULL_DECK)
+        self.pos = 52  # Cards left in the deck, cards[:pos]
         self.seed = seed
-        if seed is not None:
-            random.seed(seed)
-        self.reset()
+        self._rng = random.Random(seed)
 
     def reset(self):
-        """Reset deck to full 52 cards."""
-        self.cards = []
-        for suit in [Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS]:
-            for rank in [Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE, Rank.SIX,
-                        Rank.SEVEN, Rank.EIGHT, Rank.NINE, Rank.TEN, Rank.JACK,
-                        Rank.QUEEN, Rank.KING, Rank.ACE]:
-                self.cards.append(Card(rank, suit))
-
-    def shuffle(self):
-        """Shuffle the deck."""
-        random.shuffle(self.cards)
+        """Return all 52 cards to the deck. Their order does not matter."""
+        self.pos = 52
 
     def deal(self, num_cards: int = 1) -> List[Card]:
-        """Deal cards from the deck."""
-        if len(self.cards) < num_cards:
+        """Deal random cards from the deck."""
+        if self.pos < num_cards:
             raise ValueError(f"Not enough cards in deck")
+        cards = self.cards
+        rand = self._rng.random
         dealt = []
-        for _ in range(num_cards):
-            dealt.append(self.cards.pop())
+        for top in range(self.pos - 1, self.pos - 1 - num_cards, -1):
+            pick = int(rand() * (top + 1))
+            cards[top], cards[pick] = cards[pick], cards[top]
+            dealt.append(CARDS_BY_INDEX[cards[top]])
+        self.pos -= num_cards
         return dealt
 
 
+def _to_cents(dollars: float) -> int:
+    """Convert a dollar amount to whole cents."""
+    return int(round(dollars * 100))
+
+
 class SimulationPlayer:
-    """Player for simulation with agent brain."""
+    """
+    Player for simulation with agent brain.
+
+    Stack and bets are integer cents (see SimulationGame).
+    """
+
+    __slots__ = ('name', 'stack', 'position', 'brain_module', 'hole_cards', 'current_bet',
+                 'total_invested', 'is_active', 'is_all_in', 'played_voluntarily')
 
-    def __init__(self, name: str, stack: float, position: int, brain_module: object):
+    def __init__(self, name: str, stack: int, position: int, brain_module: object):
         self.name = name
         self.stack = stack
         self.position = position
         self.brain_module = brain_module
         self.hole_cards: List[Card] = []
-        self.current_bet = 0.0
-        self.total_invested = 0.0
+        self.current_bet = 0
+        self.total_invested = 0
         self.is_active = True
         self.is_all_in = False
         self.played_voluntarily = False
 
+    def reassign(self, stack: int, position: int):
+        """
+        Seat the player for another hand with the given stack (cents) and
+        position. The per-hand state is reset by SimulationGame.play_hand.
+        """
+        self.stack = stack
+        self.position = position
+
     def reset_for_new_hand(self):
         """Reset for new hand."""
         self.hole_cards = []
-        self.current_bet = 0.0
-        self.total_invested = 0.0
+        self.current_bet = 0
+        self.total_invested = 0
         self.is_active = True
         self.is_all_in = False
         self.played_voluntarily = False
 
-    def post_blind(self, amount: float):
+    def post_blind(self, amount: int):
         """Post a blind bet."""
         actual_bet = min(amount, self.stack)
         self.stack -= actual_bet
@@ -178,7 +236,7 @@ class SimulationPlayer:
         if self.stack == 0:
             self.is_all_in = True
 
-    def bet(self, amount: float) -> float:
+    def bet(self, amount: int) -> int:
         """Make a bet or raise."""
         additional = amount - self.current_bet
         actual_additional = min(additional, self.stack)
@@ -193,50 +251,119 @@ class SimulationPlayer:
         """Fold hand."""
         self.is_active = False
 
-    def win_pot(self, amount: float):
+    def win_pot(self, amount: int):
         """Add winnings to stack."""
         self.stack += amount
 
 
+# Memoize preflop brain decisions. Both shipped brains decide preflop from
+# the hand class (ranks and suitedness) and the betting state alone, with no
+# randomness; turn this off for a brain that does not.
+CACHE_PREFLOP_DECISIONS = True
+
+# (brain module, high rank, low rank, suited, position, pot, stack, big blind,
+# facing_raise, raise_amount, is_first_to_act) -> (action, bet_size), money in cents
+_preflop_cache: Dict[tuple, Tuple[str, int]] = {}
+
+# Entries kept before the cache starts over; stacks drift from hand to hand,
+# so without a cap a long run would keep adding keys
+_PREFLOP_CACHE_MAX = 1 << 16
+
+
+def _preflop_decision(player: 'SimulationPlayer', pot: int, big_blind: int, facing_raise: bool,
+                      raise_amount: Optional[int], is_first_to_act: bool) -> Tuple[str, int]:
+    """
+    Ask the player's brain for a preflop decision, through _preflop_cache.
+
+    Takes and returns cents; the brain itself sees dollars.
+    """
+    card1, card2 = player.hole_cards
+    if CACHE_PREFLOP_DECISIONS:
+        rank1 = card1.get_rank_value()
+        rank2 = card2.get_rank_value()
+        key = (player.brain_module, max(rank1, rank2), min(rank1, rank2), card1.suit == card2.suit,
+               player.position, pot, player.stack, big_blind, facing_raise, raise_amount,
+               is_first_to_act)
+        decision = _preflop_cache.get(key)
+        if decision is not None:
+            return decision
+
+    action, bet_size = player.brain_module.make_preflop_decision(
+        hand=(card1, card2),
+        position=player.position,
+        pot=pot / 100,
+        current_stack=player.stack / 100,
+        big_blind=big_blind / 100,
+        facing_raise=facing_raise,
+        raise_amount=None if raise_amount is None else raise_amount / 100,
+        facing_3bet=False,
+        facing_4bet=False,
+        is_first_to_act=is_first_to_act
+    )
+    decision = (action, _to_cents(bet_size))
+
+    if CACHE_PREFLOP_DECISIONS:
+        if len(_preflop_cache) >= _PREFLOP_CACHE_MAX:
+            _preflop_cache.clear()
+        _preflop_cache[key] = decision
+    return decision
+
+
 class SimulationGame:
     """
     Poker game for simulation purposes.
     Uses agent brains for decision making.
+
+    Money is kept in integer cents: blinds, stacks, bets, the pot and the
+    amount play_hand reports won. Blinds and stacks are given in dollars and
+    converted once; the brains are still asked and answer in dollars.
     """
 
-    def __init__(self, small_blind: float = 5.0, big_blind: float = 10.0, seed: int = None):
-        self.small_blind = small_blind
-        self.big_blind = big_blind
+    def __init__(self, small_blind: float = 5.0, big_blind: float = 10.0, seed: int = None,
+                 record_history: bool = True):
+        """
+        Args:
+            small_blind: Small blind amount in dollars
+            big_blind: Big blind amount in dollars
+            seed: Random seed for the deck
+            record_history: Log every action to action_history. Without it no
+                history strings are formatted and action_history stays empty.
+        """
+        self.small_blind = _to_cents(small_blind)
+        self.big_blind = _to_cents(big_blind)
         self.deck = SimulationDeck(seed)
         self.players: List[SimulationPlayer] = []
+        # Players indexed by position (0 = big blind, 1 = button), filled in
+        # each hand by reset_for_new_hand
+        self._by_position: List[Optional[SimulationPlayer]] = [None, None]
         self.board: List[Card] = []
-        self.pot = 0.0
-        self.current_bet = 0.0
+        self.pot = 0
+        self.current_bet = 0
         self.game_phase = "preflop"
+        self.record_history = record_history
         self.action_history: List[str] = []
 
     def add_player(self, name: str, stack: float, position: int, brain_module: object) -> SimulationPlayer:
-        """Add a player with specified brain module."""
-        player = SimulationPlayer(name, stack, position, brain_module)
+        """Add a player with specified brain module and a stack in dollars."""
+        player = SimulationPlayer(name, _to_cents(stack), position, brain_module)
         self.players.append(player)
         return player
 
     def reset_for_new_hand(self):
         """Reset game state for new hand."""
         self.deck.reset()
-        self.deck.shuffle()
         self.board = []
-        self.pot = 0.0
-        self.current_bet = 0.0
+        self.pot = 0
+        self.current_bet = 0
         self.game_phase = "preflop"
         self.action_history = []
         for player in self.players:
             player.reset_for_new_hand()
+            self._by_position[player.position] = player
 
     def post_blinds(self):
         """Post blinds."""
-        button = next(p for p in self.players if p.position == 1)
-        bb = next(p for p in self.players if p.position == 0)
+        bb, button = self._by_position
 
         button.post_blind(self.small_blind)
         sb_posted = button.current_bet
@@ -247,8 +374,9 @@ class SimulationGame:
         self.pot = sb_posted + bb_posted
         self.current_bet = bb_posted
 
-        self.action_history.append(f"{button.name} posts SB ${sb_posted:.2f}")
-        self.action_history.append(f"{bb.name} posts BB ${bb_posted:.2f}")
+        if self.record_history:
+            self.action_history.append(f"{button.name} posts SB ${sb_posted / 100:.2f}")
+            self.action_history.append(f"{bb.name} posts BB ${bb_posted / 100:.2f}")
 
     def deal_hole_cards(self):
         """Deal hole cards to players."""
@@ -260,63 +388,65 @@ class SimulationGame:
         self.deck.deal(1)  # Burn
         self.board.extend(self.deck.deal(3))
         self.game_phase = "flop"
-        self.action_history.append(f"FLOP: {', '.join(str(c) for c in self.board[:3])}")
+        if self.record_history:
+            self.action_history.append(f"FLOP: {', '.join(str(c) for c in self.board[:3])}")
 
     def deal_turn(self):
         """Deal the turn."""
         self.deck.deal(1)  # Burn
         self.board.append(self.deck.deal(1)[0])
         self.game_phase = "turn"
-        self.action_history.append(f"TURN: {self.board[3]}")
+        if self.record_history:
+            self.action_history.append(f"TURN: {self.board[3]}")
 
     def deal_river(self):
         """Deal the river."""
         self.deck.deal(1)  # Burn
         self.board.append(self.deck.deal(1)[0])
         self.game_phase = "river"
-        self.action_history.append(f"RIVER: {self.board[4]}")
+        if self.record_history:
+            self.action_history.append(f"RIVER: {self.board[4]}")
 
     def betting_round(self, phase: str) -> bool:
         """Execute a betting round. Returns True if hand continues."""
         if phase != "preflop":
-            self.current_bet = 0.0
+            self.current_bet = 0
             for player in self.players:
-                player.current_bet = 0.0
-
-        # Determine action order
-        if phase == "preflop":
-            action_order = sorted([p for p in self.players if p.is_active and not p.is_all_in],
-                                key=lambda p: p.position, reverse=True)
+                player.current_bet = 0
+
+        # Determine action order. The game is heads-up (unpacking fails for
+        # any other table size): the button (position 1) acts first preflop
+        # and last after the flop.
+        player_a, player_b = self.players
+        if (player_a.position == 1) == (phase == "preflop"):
+            first, second = player_a, player_b
         else:
-            action_order = sorted([p for p in self.players if p.is_active and not p.is_all_in],
-                                key=lambda p: p.position)
+            first, second = player_b, player_a
 
-        if len(action_order) <= 1:
+        # Nobody to bet against once either player is all in (or folded)
+        if (not first.is_active or first.is_all_in
+                or not second.is_active or second.is_all_in):
             return True
 
         action_count = 0
-        last_raiser = None
-
-        while True:
-            current_player = action_order[action_count % len(action_order)]
+        record = self.record_history
+
+        # Players who have acted since the last raise, the raiser included.
+        # The round is over once both have: a check or call never reopens the
+        # betting, and every raise adds at least a big blind to the bet (or
+        # puts the raiser all in), so this is reached after a bounded number
+        # of actions. A player who went all in has nothing left to do, and
+        # their turn counts as acting.
+        acted = 0
+
+        while acted < 2:
+            current_player = second if action_count & 1 else first
+            action_count += 1
 
             if current_player.is_all_in:
-                action_count += 1
-                if action_count > len(action_order) * 20:
-                    break
+                acted += 1
                 continue
 
-            all_matched = all(p.current_bet == self.current_bet or not p.is_active or p.is_all_in
-                            for p in self.players)
-
-            if all_matched and action_count >= len(action_order):
-                if last_raiser is None or action_count >= len(action_order) + action_order.index(last_raiser):
-                    break
-
-            active_players = [p for p in self.players if p.is_active and not p.is_all_in]
-            if len(active_players) == 0:
-                break
-
             # Get decision from agent's brain
             facing_raise = current_player.current_bet < self.current_bet
             facing_bet = facing_raise
@@ -333,29 +463,21 @@ class SimulationGame:
                                        self.current_bet == self.big_blind)
 
                 if is_button_completing:
-                    action, bet_size = current_player.brain_module.make_preflop_decision(
-                        hand=tuple(current_player.hole_cards),
-                        position=current_player.position,
+                    action, bet_size = _preflop_decision(
+                        current_player,
                         pot=self.pot,
-                        current_stack=current_player.stack,
                         big_blind=self.big_blind,
                         facing_raise=False,  # Treat as first to act
                         raise_amount=None,
-                        facing_3bet=False,
-                        facing_4bet=False,
                         is_first_to_act=True
                     )
                 else:
-                    action, bet_size = current_player.brain_module.make_preflop_decision(
-                        hand=tuple(current_player.hole_cards),
-                        position=current_player.position,
+                    action, bet_size = _preflop_decision(
+                        current_player,
                         pot=self.pot,
-                        current_stack=current_player.stack,
                         big_blind=self.big_blind,
                         facing_raise=facing_raise,
                         raise_amount=raise_amount,
-                        facing_3bet=False,
-                        facing_4bet=False,
                         is_first_to_act=False
                     )
             else:
@@ -363,15 +485,16 @@ class SimulationGame:
                     hand=tuple(current_player.hole_cards),
                     board=self.board,
                     position=current_player.position,
-                    pot=self.pot,
-                    current_stack=current_player.stack,
-                    big_blind=self.big_blind,
+                    pot=self.pot / 100,
+                    current_stack=current_player.stack / 100,
+                    big_blind=self.big_blind / 100,
                     is_in_position=is_in_position,
                     is_preflop_aggressor=is_preflop_aggressor,
                     facing_bet=facing_bet,
-                    bet_amount=bet_amount,
+                    bet_amount=None if bet_amount is None else bet_amount / 100,
                     street=phase
                 )
+                bet_size = _to_cents(bet_size)
 
             # Track VPIP (any action other than fold/check when first to act preflop)
             if phase == "preflop" and action in ["call", "raise"]:
@@ -380,12 +503,15 @@ class SimulationGame:
             # Execute action
             if action == "fold":
                 current_player.fold()
-                self.action_history.append(f"{current_player.name} folds")
+                if record:
+                    self.action_history.append(f"{current_player.name} folds")
                 return False
 
             elif action == "check":
                 # Check means no additional bet
-                self.action_history.append(f"{current_player.name} checks")
+                acted += 1
+                if record:
+                    self.action_history.append(f"{current_player.name} checks")
 
             elif action == "call":
                 call_amount = self.current_bet
@@ -393,33 +519,31 @@ class SimulationGame:
                 actual_bet = current_player.bet(call_amount)
                 additional = actual_bet - old_bet
                 self.pot += additional
-                if current_player.is_all_in:
-                    self.action_history.append(f"{current_player.name} calls ${additional:.2f} (all-in)")
-                else:
-                    self.action_history.append(f"{current_player.name} calls ${additional:.2f}")
+                acted += 1
+                if record:
+                    if current_player.is_all_in:
+                        self.action_history.append(f"{current_player.name} calls ${additional / 100:.2f} (all-in)")
+                    else:
+                        self.action_history.append(f"{current_player.name} calls ${additional / 100:.2f}")
 
             elif action == "raise":
-                raise_to = max(bet_size, self.current_bet * 2)
+                # Min raise: double the bet, and never less than a big blind
+                # more (an unopened pot has nothing to double)
+                raise_to = max(bet_size, self.current_bet * 2, self.current_bet + self.big_blind)
                 old_bet = current_player.current_bet
                 actual_bet = current_player.bet(raise_to)
                 additional = actual_bet - old_bet
                 self.pot += additional
                 self.current_bet = actual_bet
-                last_raiser = current_player
-                if current_player.is_all_in:
-                    self.action_history.append(f"{current_player.name} raises to ${actual_bet:.2f} (all-in)")
-                else:
-                    self.action_history.append(f"{current_player.name} raises to ${raise_to:.2f}")
-
-            elif action == "check":
-                self.action_history.append(f"{current_player.name} checks")
+                acted = 1
+                if record:
+                    if current_player.is_all_in:
+                        self.action_history.append(f"{current_player.name} raises to ${actual_bet / 100:.2f} (all-in)")
+                    else:
+                        self.action_history.append(f"{current_player.name} raises to ${raise_to / 100:.2f}")
 
-            action_count += 1
-            if action_count > 100:
-                raise RuntimeError("Betting round exceeded maximum actions")
-
-        for player in self.players:
-            player.current_bet = 0.0
+            else:
+                raise ValueError(f"Unknown action {action!r} from {current_player.name}")
 
         return True
 
@@ -432,41 +556,41 @@ class SimulationGame:
             return (active_players[0], "opponent folded")
 
         best_player = None
-        best_score = (0, [], {})
-
-        hand_names = {
-            10: "Royal Flush", 9: "Straight Flush", 8: "Quads",
-            7: "Boat", 6: "Flush", 5: "Straight",
-            4: "Trips", 3: "Two Pair", 2: "One Pair", 1: "High Card"
-        }
+        best_key = -1
 
-        for player in active_players:
-            all_cards = player.hole_cards + self.board
-            score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=player.hole_cards)
+        # Rank every hand in one batch call on card codes: the deck never
+        # deals duplicates and the showdown needs no rank_hand metadata.
+        # Packed scores compare as single ints; the first best hand wins ties.
+        board_codes = [c.ck32 for c in self.board]
+        keys = rank_hands_batch_packed(
+            [[p.hole_cards[0].ck32, p.hole_cards[1].ck32] + board_codes for p in active_players])
 
-            hand_name = hand_names.get(score, "Unknown")
-            self.action_history.append(f"{player.name} shows {player.hole_cards[0]}, {player.hole_cards[1]}: {hand_name}")
+        for player, key in zip(active_players, keys):
+            if self.record_history:
+                hand_name = HAND_NAMES.get(key >> 20, "Unknown")
+                self.action_history.append(f"{player.name} shows {player.hole_cards[0]}, {player.hole_cards[1]}: {hand_name}")
 
-            current_score = (score, tiebreakers)
-            if best_player is None or current_score > best_score[:2]:
+            if key > best_key:
                 best_player = player
-                best_score = (score, tiebreakers, metadata)
+                best_key = key
 
-        hand_description = hand_names.get(best_score[0], "Unknown")
+        hand_description = HAND_NAMES.get(best_key >> 20, "Unknown")
         return (best_player, hand_description)
 
     def award_pot(self, winner: SimulationPlayer):
         """Award pot to winner."""
         winner.win_pot(self.pot)
-        self.action_history.append(f"{winner.name} wins ${self.pot:.2f}")
-        self.pot = 0.0
+        if self.record_history:
+            self.action_history.append(f"{winner.name} wins ${self.pot / 100:.2f}")
+        self.pot = 0
 
-    def play_hand(self) -> Tuple[SimulationPlayer, float, str, bool]:
+    def play_hand(self) -> Tuple[SimulationPlayer, int, str, bool]:
         """
         Play a complete hand.
 
         Returns:
-            Tuple of (winner, amount_won, hand_description, went_to_showdown)
+            Tuple of (winner, amount_won, hand_description, went_to_showdown),
+            amount_won in cents
         """
         self.reset_for_new_hand()
         self.post_blinds()
@@ -474,42 +598,41 @@ class SimulationGame:
 
         # Preflop
         if not self.betting_round("preflop"):
-            winner = next(p for p in self.players if p.is_active)
+            winner = self.players[0] if self.players[0].is_active else self.players[1]
             amount_won = self.pot
             self.award_pot(winner)
             return (winner, amount_won, "opponent folded", False)
 
-        both_all_in = all(p.is_all_in or not p.is_active for p in self.players)
+        # Heads-up, a fold ends the hand inside betting_round, so both players
+        # are still in from here on. Once either is all in nobody can bet
+        # again (betting_round would return straight away), and the rest of
+        # the board is just dealt.
+        player_a, player_b = self.players
+        board_only = player_a.is_all_in or player_b.is_all_in
 
         # Flop
-        if len([p for p in self.players if p.is_active]) > 1:
-            self.deal_flop()
-            if not both_all_in:
-                if not self.betting_round("flop"):
-                    winner = next(p for p in self.players if p.is_active)
-                    amount_won = self.pot
-                    self.award_pot(winner)
-                    return (winner, amount_won, "opponent folded", False)
+        self.deal_flop()
+        if not board_only and not self.betting_round("flop"):
+            winner = player_a if player_a.is_active else player_b
+            amount_won = self.pot
+            self.award_pot(winner)
+            return (winner, amount_won, "opponent folded", False)
 
         # Turn
-        if len([p for p in self.players if p.is_active]) > 1:
-            self.deal_turn()
-            if not both_all_in:
-                if not self.betting_round("turn"):
-                    winner = next(p for p in self.players if p.is_active)
-                    amount_won = self.pot
-                    self.award_pot(winner)
-                    return (winner, amount_won, "opponent folded", False)
+        self.deal_turn()
+        if not board_only and not self.betting_round("turn"):
+            winner = player_a if player_a.is_active else player_b
+            amount_won = self.pot
+            self.award_pot(winner)
+            return (winner, amount_won, "opponent folded", False)
 
         # River
-        if len([p for p in self.players if p.is_active]) > 1:
-            self.deal_river()
-            if not both_all_in:
-                if not self.betting_round("river"):
-                    winner = next(p for p in self.players if p.is_active)
-                    amount_won = self.pot
-                    self.award_pot(winner)
-                    return (winner, amount_won, "opponent folded", False)
+        self.deal_river()
+        if not board_only and not self.betting_round("river"):
+            winner = player_a if player_a.is_active else player_b
+            amount_won = self.pot
+            self.award_pot(winner)
+            return (winner, amount_won, "opponent folded", False)
 
         # Showdown
         winner, hand_desc = self.showdown()
@@ -527,7 +650,10 @@ def run_simulation(
     big_blind: float = 10.0,
     seed: int = None,
     verbose: bool = False,
-    show_progress: bool = True
+    show_progress: bool = True,
+    workers: Optional[int] = 1,
+    save_history: bool = False,
+    streaming_csv: Optional[str] = None
 ) -> SimulationResult:
     """
     Run a simulation between two agents.
@@ -542,107 +668,242 @@ def run_simulation(
         seed: Random seed for reproducibility
         verbose: Print detailed hand information
         show_progress: Show progress bar
+        workers: Worker processes to split the hands across (None = one per CPU).
+            Each worker plays an independent session of num_hands / workers hands
+            from the starting stacks, seeded seed, seed + 1, ... Runs under
+            PARALLEL_MIN_HANDS hands, or where processes cannot be forked, stay
+            in this process.
+        save_history: Record each hand's action history (needed by
+            save_hand_histories). Off, every HandResult.action_history is ().
+        streaming_csv: Write each hand's row to this CSV file as it is played
+            (same format as save_results_to_csv) instead of keeping it in
+            hand_results, so memory stays flat however many hands are run.
+            Streaming runs stay in this process, and save_history is ignored:
+            save_hand_histories cannot be used with the result.
 
     Returns:
         SimulationResult with statistics and hand histories
     """
+    if streaming_csv is not None:
+        save_history = False
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if (workers > 1 and num_hands >= PARALLEL_MIN_HANDS and streaming_csv is None
+            and 'fork' in multiprocessing.get_all_start_methods()):
+        return _run_parallel_simulation(num_hands, agent1_config, agent2_config, starting_stack,
+                                        small_blind, big_blind, seed, verbose, show_progress, workers,
+                                        save_history)
+
     result = SimulationResult(
         num_hands=num_hands,
         agent1_stats=SimulationStats(agent_name=agent1_config.name),
         agent2_stats=SimulationStats(agent_name=agent2_config.name),
-        start_time=datetime.now()
+        start_time=datetime.now(),
+        history_saved=save_history,
+        streamed_to=streaming_csv
     )
 
-    # Initialize game
+    # Initialize game. The deck has its own generator; the global one is
+    # still seeded because the brains draw from it (e.g. c-bet sizing).
     if seed is not None:
         random.seed(seed)
 
-    game = SimulationGame(small_blind=small_blind, big_blind=big_blind, seed=seed)
-
-    # Reset stacks to starting amount for each session
-    player1_stack = starting_stack
-    player2_stack = starting_stack
-
-    # Progress tracking
-    progress_interval = max(1, num_hands // 20)  # Update every 5%
-
-    for hand_num in range(1, num_hands + 1):
-        # Create fresh players for this hand with current stacks
-        game.players = []
-        position1 = (hand_num - 1) % 2  # Alternates 0, 1, 0, 1...
-        position2 = 1 - position1
-
-        p1 = game.add_player(agent1_config.name, player1_stack, position1, agent1_config.brain_module)
-        p2 = game.add_player(agent2_config.name, player2_stack, position2, agent2_config.brain_module)
-
-        # Store stacks before hand
-        p1_stack_before = p1.stack
-        p2_stack_before = p2.stack
-
-        # Play the hand
-        winner, amount_won, description, went_to_showdown = game.play_hand()
-
-        # Update stacks
-        player1_stack = p1.stack
-        player2_stack = p2.stack
-
-        # Record hand result
-        hand_result = HandResult(
-            hand_number=hand_num,
-            winner_name=winner.name,
-            amount_won=amount_won,
-            win_description=description,
-            player1_cards=[str(c) for c in p1.hole_cards] if p1.hole_cards else [],
-            player2_cards=[str(c) for c in p2.hole_cards] if p2.hole_cards else [],
-            board=[str(c) for c in game.board],
-            player1_stack_before=p1_stack_before,
-            player2_stack_before=p2_stack_before,
-            player1_stack_after=p1.stack,
-            player2_stack_after=p2.stack,
-            action_history=game.action_history.copy()
-        )
-        result.hand_results.append(hand_result)
-
-        # Update statistics
-        result.agent1_stats.total_hands_dealt += 1
-        result.agent2_stats.total_hands_dealt += 1
-
-        if p1.played_voluntarily:
-            result.agent1_stats.hands_played_voluntarily += 1
-        if p2.played_voluntarily:
-            result.agent2_stats.hands_played_voluntarily += 1
-
-        if winner.name == agent1_config.name:
-            result.agent1_stats.hands_won += 1
-            result.agent1_stats.total_profit += (p1.stack - p1_stack_before)
-            result.agent2_stats.hands_lost += 1
-            result.agent2_stats.total_profit += (p2.stack - p2_stack_before)
-        else:
-            result.agent2_stats.hands_won += 1
-            result.agent2_stats.total_profit += (p2.stack - p2_stack_before)
-            result.agent1_stats.hands_lost += 1
-            result.agent1_stats.total_profit += (p1.stack - p1_stack_before)
-
-        if went_to_showdown:
-            result.agent1_stats.showdowns_total += 1
-            result.agent2_stats.showdowns_total += 1
-            if winner.name == agent1_config.name:
-                result.agent1_stats.showdowns_won += 1
+    game = SimulationGame(small_blind=small_blind, big_blind=big_blind, seed=seed,
+                          record_history=save_history)
+
+    # The same two players are reseated for every hand, starting each
+    # session from the starting stack
+    p1 = game.add_player(agent1_config.name, starting_stack, 0, agent1_config.brain_module)
+    p2 = game.add_player(agent2_config.name, starting_stack, 1, agent2_config.brain_module)
+
+    # Progress tracking: redraw at every 5% milestone
+    progress_interval = max(1, num_hands // 20)
+    next_progress = progress_interval
+
+    # Stats counters live in locals during the loop and are written to the
+    # SimulationStats once at the end
+    agent1_name = agent1_config.name
+    agent1_wins = 0
+    agent1_showdown_wins = 0
+    showdowns = 0
+    agent1_vpip = 0
+    agent2_vpip = 0
+    agent1_profit = 0  # cents
+    agent2_profit = 0
+
+    # Streaming writes each hand's CSV row as soon as it is played instead of
+    # keeping a HandResult for it
+    csv_file = None
+    writer = None
+    if streaming_csv is not None:
+        csv_file = open(streaming_csv, 'w', newline='', buffering=1 << 20)
+        writer = csv.writer(csv_file)
+        writer.writerow(_CSV_HEADER)
+
+    try:
+        for hand_num in range(1, num_hands + 1):
+            # Store stacks before hand
+            p1_stack_before = p1.stack
+            p2_stack_before = p2.stack
+
+            position1 = (hand_num - 1) % 2  # Alternates 0, 1, 0, 1...
+            p1.reassign(p1_stack_before, position1)
+            p2.reassign(p2_stack_before, 1 - position1)
+
+            # Play the hand
+            winner, amount_won, description, went_to_showdown = game.play_hand()
+
+            # Stacks after the hand, in dollars
+            player1_stack = p1.stack / 100
+            player2_stack = p2.stack / 100
+            amount_won /= 100
+
+            # Record hand result
+            player1_cards_str = ' '.join([_CARD_STR[c.index] for c in p1.hole_cards])
+            player2_cards_str = ' '.join([_CARD_STR[c.index] for c in p2.hole_cards])
+            board_str = ' '.join([_CARD_STR[c.index] for c in game.board])
+            if writer is not None:
+                writer.writerow((hand_num, winner.name, amount_won, description,
+                                 player1_cards_str, player2_cards_str, board_str,
+                                 p1_stack_before / 100, p2_stack_before / 100,
+                                 player1_stack, player2_stack))
             else:
-                result.agent2_stats.showdowns_won += 1
+                result.hand_results.append(HandResult(
+                    hand_number=hand_num,
+                    winner_name=winner.name,
+                    amount_won=amount_won,
+                    win_description=description,
+                    player1_cards_str=player1_cards_str,
+                    player2_cards_str=player2_cards_str,
+                    board_str=board_str,
+                    player1_stack_before=p1_stack_before / 100,
+                    player2_stack_before=p2_stack_before / 100,
+                    player1_stack_after=player1_stack,
+                    player2_stack_after=player2_stack,
+                    action_history=game.action_history if save_history else ()
+                ))
+
+            # Update statistics
+            if p1.played_voluntarily:
+                agent1_vpip += 1
+            if p2.played_voluntarily:
+                agent2_vpip += 1
+
+            agent1_profit += p1.stack - p1_stack_before
+            agent2_profit += p2.stack - p2_stack_before
+            agent1_won = winner.name == agent1_name
+            if agent1_won:
+                agent1_wins += 1
+
+            if went_to_showdown:
+                showdowns += 1
+                if agent1_won:
+                    agent1_showdown_wins += 1
+
+            # Verbose output
+            if verbose:
+                print(f"Hand {hand_num}: {winner.name} wins ${amount_won:.2f} ({description})")
+                print(f"  {agent1_config.name}: ${player1_stack:.2f}, {agent2_config.name}: ${player2_stack:.2f}")
+
+            # Progress bar
+            if show_progress and hand_num == next_progress:
+                _print_progress(hand_num, num_hands)
+                next_progress += progress_interval
+    finally:
+        if csv_file is not None:
+            csv_file.flush()
+            os.fsync(csv_file.fileno())
+            csv_file.close()
 
-        # Verbose output
-        if verbose:
-            print(f"Hand {hand_num}: {winner.name} wins ${amount_won:.2f} ({description})")
-            print(f"  {agent1_config.name}: ${player1_stack:.2f}, {agent2_config.name}: ${player2_stack:.2f}")
+    if show_progress:
+        print()  # New line after progress bar
+
+    stats1 = result.agent1_stats
+    stats1.total_hands_dealt = num_hands
+    stats1.hands_won = agent1_wins
+    stats1.hands_lost = num_hands - agent1_wins
+    stats1.total_profit = agent1_profit / 100
+    stats1.showdowns_total = showdowns
+    stats1.showdowns_won = agent1_showdown_wins
+    stats1.hands_played_voluntarily = agent1_vpip
+
+    stats2 = result.agent2_stats
+    stats2.total_hands_dealt = num_hands
+    stats2.hands_won = num_hands - agent1_wins
+    stats2.hands_lost = agent1_wins
+    stats2.total_profit = agent2_profit / 100
+    stats2.showdowns_total = showdowns
+    stats2.showdowns_won = showdowns - agent1_showdown_wins
+    stats2.hands_played_voluntarily = agent2_vpip
+
+    result.end_time = datetime.now()
+    return result
 
-        # Progress bar
-        if show_progress and hand_num % progress_interval == 0:
-            progress = hand_num / num_hands * 100
-            bar_length = 30
-            filled = int(bar_length * hand_num / num_hands)
-            bar = '=' * filled + '-' * (bar_length - filled)
-            print(f"\rProgress: [{bar}] {progress:.0f}% ({hand_num}/{num_hands})", end='', flush=True)
+
+# Smallest run worth splitting across processes; below this, forking workers
+# and shipping results back costs more than it saves
+PARALLEL_MIN_HANDS = 1000
+
+# Arguments shared by every chunk of a parallel run. Set just before the
+# worker processes are forked so they inherit it: agent configs hold brain
+# modules, which cannot be pickled.
+_chunk_context: Optional[tuple] = None
+
+
+def _simulate_chunk(chunk: Tuple[int, Optional[int]]) -> SimulationResult:
+    """Play one independent session of a parallel run (in a worker process)."""
+    num_hands, seed = chunk
+    agent1_config, agent2_config, starting_stack, small_blind, big_blind, verbose, save_history = _chunk_context
+    return run_simulation(num_hands, agent1_config, agent2_config, starting_stack,
+                          small_blind, big_blind, seed=seed, verbose=verbose, show_progress=False,
+                          save_history=save_history)
+
+
+def _run_parallel_simulation(num_hands: int, agent1_config: AgentConfig, agent2_config: AgentConfig,
+                             starting_stack: float, small_blind: float, big_blind: float,
+                             seed: Optional[int], verbose: bool, show_progress: bool,
+                             workers: int, save_history: bool) -> SimulationResult:
+    """
+    run_simulation split into one session per worker process.
+
+    Hand results are concatenated in chunk order and renumbered; the stats
+    counters of every chunk are summed.
+    """
+    global _chunk_context
+
+    result = SimulationResult(
+        num_hands=num_hands,
+        agent1_stats=SimulationStats(agent_name=agent1_config.name),
+        agent2_stats=SimulationStats(agent_name=agent2_config.name),
+        start_time=datetime.now(),
+        history_saved=save_history
+    )
+
+    # Spread the remainder over the first chunks
+    base, extra = divmod(num_hands, workers)
+    chunks = [(base + (1 if i < extra else 0), None if seed is None else seed + i)
+              for i in range(workers)]
+
+    _chunk_context = (agent1_config, agent2_config, starting_stack, small_blind, big_blind, verbose,
+                      save_history)
+    try:
+        with multiprocessing.get_context('fork').Pool(workers) as pool:
+            hands_done = 0
+            for chunk_result in pool.imap(_simulate_chunk, chunks):
+                for hand_result in chunk_result.hand_results:
+                    hand_result.hand_number += hands_done
+                result.hand_results.extend(chunk_result.hand_results)
+                hands_done += chunk_result.num_hands
+                for stats, chunk_stats in ((result.agent1_stats, chunk_result.agent1_stats),
+                                           (result.agent2_stats, chunk_result.agent2_stats)):
+                    for stat in fields(SimulationStats):
+                        if stat.name != 'agent_name':
+                            setattr(stats, stat.name,
+                                    getattr(stats, stat.name) + getattr(chunk_stats, stat.name))
+                if show_progress:
+                    _print_progress(hands_done, num_hands)
+    finally:
+        _chunk_context = None
 
     if show_progress:
         print()  # New line after progress bar
@@ -651,6 +912,15 @@ def run_simulation(
     return result
 
 
+def _print_progress(hand_num: int, num_hands: int):
+    """Redraw the progress bar in place."""
+    progress = hand_num / num_hands * 100
+    bar_length = 30
+    filled = int(bar_length * hand_num / num_hands)
+    bar = '=' * filled + '-' * (bar_length - filled)
+    print(f"\rProgress: [{bar}] {progress:.0f}% ({hand_num}/{num_hands})", end='', flush=True)
+
+
 def print_simulation_summary(result: SimulationResult):
     """Print a summary of simulation results."""
     print()
@@ -694,34 +964,36 @@ def save_results_to_csv(result: SimulationResult, filename: str = "simulation_re
     Args:
         result: SimulationResult to save
         filename: Output filename (default: simulation_results.csv, overwrites existing)
+
+    Raises:
+        ValueError: If the simulation streamed its hands to a CSV already
     """
+    if result.streamed_to is not None:
+        raise ValueError(f"Hands were already streamed to {result.streamed_to}")
 
-    with open(filename, 'w', newline='') as csvfile:
+    with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
         writer = csv.writer(csvfile)
 
         # Header
-        writer.writerow([
-            'hand_number', 'winner', 'amount_won', 'description',
-            'player1_cards', 'player2_cards', 'board',
-            'player1_stack_before', 'player2_stack_before',
-            'player1_stack_after', 'player2_stack_after'
-        ])
+        writer.writerow(_CSV_HEADER)
 
         # Data rows
-        for hr in result.hand_results:
-            writer.writerow([
+        writer.writerows(
+            (
                 hr.hand_number,
                 hr.winner_name,
                 hr.amount_won,
                 hr.win_description,
-                ' '.join(hr.player1_cards),
-                ' '.join(hr.player2_cards),
-                ' '.join(hr.board),
+                hr.player1_cards_str,
+                hr.player2_cards_str,
+                hr.board_str,
                 hr.player1_stack_before,
                 hr.player2_stack_before,
                 hr.player1_stack_after,
                 hr.player2_stack_after
-            ])
+            )
+            for hr in result.hand_results
+        )
 
     print(f"Results saved to {filename}")
     return filename
@@ -734,7 +1006,14 @@ def save_hand_histories(result: SimulationResult, filename: str = "hand_historie
     Args:
         result: SimulationResult to save
         filename: Output filename (default: hand_histories.txt, overwrites existing)
+
+    Raises:
+        ValueError: If the simulation was run without save_history
     """
+    if result.streamed_to is not None:
+        raise ValueError(f"Hands were streamed to {result.streamed_to}; no hand histories to save")
+    if not result.history_saved:
+        raise ValueError("Simulation was run without save_history=True; no hand histories to save")
 
     with open(filename, 'w') as f:
         f.write("=" * 70 + "\n")
@@ -744,9 +1023,9 @@ def save_hand_histories(result: SimulationResult, filename: str = "hand_historie
         for hr in result.hand_results:
             f.write(f"--- Hand #{hr.hand_number} ---\n")
             f.write(f"Winner: {hr.winner_name} (${hr.amount_won:.2f}) - {hr.win_description}\n")
-            f.write(f"Player 1 cards: {' '.join(hr.player1_cards)}\n")
-            f.write(f"Player 2 cards: {' '.join(hr.player2_cards)}\n")
-            f.write(f"Board: {' '.join(hr.board)}\n")
+            f.write(f"Player 1 cards: {hr.player1_cards_str}\n")
+            f.write(f"Player 2 cards: {hr.player2_cards_str}\n")
+            f.write(f"Board: {hr.board_str}\n")
             f.write(f"Stacks: P1 ${hr.player1_stack_before:.2f} -> ${hr.player1_stack_after:.2f}, ")
             f.write(f"P2 ${hr.player2_stack_before:.2f} -> ${hr.player2_stack_after:.2f}\n")
             f.write("Actions:\n")
@@ -791,7 +1070,8 @@ if __name__ == "__main__":
         big_blind=10.0,
         seed=42,  # For reproducibility
         verbose=False,
-        show_progress=True
+        show_progress=True,
+        save_history=True  # Needed for save_hand_histories below
     )
 
     # Print summary
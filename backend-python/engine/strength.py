@@ -5,34 +5,16 @@ Provides preflop and postflop hand strength calculations, hand classification,
 and draw detection for Texas Hold'em poker.
 """
 
-from typing import Tuple, List
+import warnings
+from enum import IntEnum
+from typing import Dict, Iterable, List, Optional, Tuple
 from card import Card
-from hand_eval import rank_hand
+from hand_eval import RANK_MASK_BITS, rank_hand
 
 
-def calculate_preflop_strength(hand: Tuple[Card, Card]) -> float:
-    """
-    Calculate preflop hand strength as a percentile (0.0 to 1.0).
-
-    In heads-up poker, there are 169 unique starting hands:
-    - 13 pocket pairs (AA, KK, ..., 22)
-    - 78 suited hands (AKs, AQs, ..., 32s)
-    - 78 offsuit hands (AKo, AQo, ..., 32o)
-
-    Returns:
-        Float between 0.0 (weakest) and 1.0 (strongest)
-    """
-    card1, card2 = hand
-    rank1_val = card1.get_rank_value()
-    rank2_val = card2.get_rank_value()
-    is_pair = rank1_val == rank2_val
-    is_suited = card1.suit == card2.suit
-
-    # Normalize to high/low order
-    high_rank = max(rank1_val, rank2_val)
-    low_rank = min(rank1_val, rank2_val)
-
-    if is_pair:
+def _compute_preflop_strength(high_rank: int, low_rank: int, is_suited: bool) -> float:
+    """Preflop strength of a starting hand; see calculate_preflop_strength."""
+    if high_rank == low_rank:
         # Pocket pairs: AA = 1.0, KK = 0.94, ..., 22 = 0.31
         pair_strength = {
             14: 1.00,  # AA
@@ -159,19 +141,148 @@ def calculate_preflop_strength(hand: Tuple[Card, Card]) -> float:
         return max(0.05, 0.40 - (high_rank - 2) * 0.06)
 
 
+def _build_preflop_table() -> List[Optional[float]]:
+    """
+    Strength of every starting hand, indexed by
+    high_rank * 30 + low_rank * 2 + is_suited.
+
+    Only the 169 real starting hands are filled in (a pair is never suited);
+    the other slots stay None.
+    """
+    table: List[Optional[float]] = [None] * (15 * 30)
+    for high_rank in range(2, 15):
+        for low_rank in range(2, high_rank + 1):
+            for is_suited in ((False, True) if low_rank < high_rank else (False,)):
+                table[high_rank * 30 + low_rank * 2 + is_suited] = (
+                    _compute_preflop_strength(high_rank, low_rank, is_suited))
+    return table
+
+
+# Preflop strength lookup (see _build_preflop_table)
+_PREFLOP_STRENGTH = _build_preflop_table()
+
+
+def _build_preflop_index_table() -> List[Optional[float]]:
+    """
+    The _PREFLOP_STRENGTH entries by ordered pair of deck indices (see
+    Card.index), at index1 * 52 + index2. The 52 same-card slots stay None.
+    """
+    table: List[Optional[float]] = [None] * (52 * 52)
+    for index1 in range(52):
+        for index2 in range(52):
+            if index1 != index2:
+                high_rank = max(index1 % 13, index2 % 13) + 2
+                low_rank = min(index1 % 13, index2 % 13) + 2
+                is_suited = index1 // 13 == index2 // 13
+                table[index1 * 52 + index2] = _PREFLOP_STRENGTH[high_rank * 30 + low_rank * 2 + is_suited]
+    return table
+
+
+# Preflop strength by deck indices (see _build_preflop_index_table). Only the
+# batch path reads it, so it is built on first use rather than at import.
+_PREFLOP_STRENGTH_BY_INDEX: Optional[List[Optional[float]]] = None
+
+
+def calculate_preflop_strength(hand: Tuple[Card, Card]) -> float:
+    """
+    Calculate preflop hand strength as a percentile (0.0 to 1.0).
+
+    In heads-up poker, there are 169 unique starting hands:
+    - 13 pocket pairs (AA, KK, ..., 22)
+    - 78 suited hands (AKs, AQs, ..., 32s)
+    - 78 offsuit hands (AKo, AQo, ..., 32o)
+
+    Returns:
+        Float between 0.0 (weakest) and 1.0 (strongest)
+    """
+    # Rank and suit both come off the deck index (see Card.index), read once
+    # per card
+    card1, card2 = hand
+    index1 = card1.index
+    index2 = card2.index
+    high_rank = index1 % 13 + 2
+    low_rank = index2 % 13 + 2
+
+    # Normalize to high/low order
+    if high_rank < low_rank:
+        high_rank, low_rank = low_rank, high_rank
+    return _PREFLOP_STRENGTH[high_rank * 30 + low_rank * 2 + (index1 // 13 == index2 // 13)]
+
+
+def calculate_preflop_strength_batch(hands: Iterable[Tuple[Card, Card]]) -> List[float]:
+    """
+    calculate_preflop_strength for many hands in one call, for equity and
+    simulation loops.
+
+    Hands are looked up by the two cards' deck indices (see Card.index), so
+    each costs two attribute reads and one list index.
+
+    Returns:
+        Strengths (0.0 to 1.0) in input order
+    """
+    global _PREFLOP_STRENGTH_BY_INDEX
+    table = _PREFLOP_STRENGTH_BY_INDEX
+    if table is None:
+        table = _PREFLOP_STRENGTH_BY_INDEX = _build_preflop_index_table()
+    return [table[card1.index * 52 + card2.index] for card1, card2 in hands]
+
+
+# Preflop strength categories, as returned by classify_strength
+WEAK, MEDIUM, STRONG, PREMIUM = 0, 1, 2, 3
+STRENGTH_NAMES = ("Weak", "Medium", "Strong", "Premium")
+
+
+def classify_strength(hand_strength: float) -> int:
+    """
+    Categorize a preflop strength in one go: PREMIUM (AA, KK, QQ, JJ, AK; top
+    ~15%), STRONG (top 15-35%), MEDIUM (top 35-60%) or WEAK.
+    """
+    return (PREMIUM if hand_strength >= 0.82 else STRONG if hand_strength >= 0.65
+            else MEDIUM if hand_strength >= 0.40 else WEAK)
+
+
 def is_premium_hand(hand_strength: float) -> bool:
     """Check if hand is premium (AA, KK, QQ, JJ, AK)."""
-    return hand_strength >= 0.82  # Top ~15%
+    return classify_strength(hand_strength) == PREMIUM
 
 
 def is_strong_hand(hand_strength: float) -> bool:
     """Check if hand is strong (top 15-35%)."""
-    return 0.65 <= hand_strength < 0.82
+    return classify_strength(hand_strength) == STRONG
 
 
 def is_medium_hand(hand_strength: float) -> bool:
     """Check if hand is medium (top 35-60%)."""
-    return 0.40 <= hand_strength < 0.65
+    return classify_strength(hand_strength) == MEDIUM
+
+
+# Postflop hand description by rank_hand score (1-10)
+_HAND_NAMES = (
+    "Unknown", "High Card", "One Pair", "Two Pair", "Trips", "Straight",
+    "Flush", "Full House", "Quads", "Straight Flush", "Royal Flush"
+)
+
+
+class PairStrength(IntEnum):
+    """Where a one-pair hand's pair sits relative to the board."""
+    NO_PAIR = 0
+    UNDERPAIR = 1
+    THIRD_PAIR = 2
+    SECOND_PAIR = 3
+    TOP_PAIR = 4
+    OVERPAIR = 5
+
+    @property
+    def label(self) -> str:
+        """The string form used in metadata and by classify_pair_strength."""
+        return _PAIR_STRENGTH_LABELS[self]
+
+
+_PAIR_STRENGTH_LABELS = tuple(strength.name.lower() for strength in PairStrength)
+
+# Postflop hand category for a one-pair hand, by PairStrength (a pair that
+# is all on the board counts as an underpair)
+CATEGORY_BY_PAIR = ("underpair", "underpair", "third_pair", "second_pair", "top_pair", "overpair")
 
 
 def evaluate_postflop_hand(hole_cards: Tuple[Card, Card], board: List[Card]) -> Tuple[int, str, dict]:
@@ -188,19 +299,22 @@ def evaluate_postflop_hand(hole_cards: Tuple[Card, Card], board: List[Card]) ->
         return (0, "no board", {})
 
     all_cards = list(hole_cards) + board
-    score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=list(hole_cards))
+    score, tiebreakers, rank_meta = rank_hand(all_cards, hole_cards=list(hole_cards))
+    metadata = rank_meta.to_dict()
 
-    hand_names = {
-        10: "Royal Flush", 9: "Straight Flush", 8: "Quads",
-        7: "Full House", 6: "Flush", 5: "Straight",
-        4: "Trips", 3: "Two Pair", 2: "One Pair", 1: "High Card"
-    }
+    hand_desc = _HAND_NAMES[score]
 
-    hand_desc = hand_names.get(score, "Unknown")
+    # One pass over the cards for both the draw and pair checks below
+    rank_mask, suit_masks, (rank1, rank2), board_mask = _extract_features(hole_cards, board)
 
-    # Check for draws
-    draws = check_for_draws(hole_cards, board)
-    metadata.update(draws)
+    # Check for draws (as check_for_draws, straight into metadata)
+    if len(board) < 3:
+        flush_draw = oesd = gutshot = False
+    else:
+        flush_draw, oesd, gutshot = _draw_flags(rank_mask, suit_masks)
+    metadata['flush_draw'] = flush_draw
+    metadata['oesd'] = oesd
+    metadata['gutshot'] = gutshot
 
     # Determine hand category
     if score >= 5:  # Straight or better
@@ -211,20 +325,9 @@ def evaluate_postflop_hand(hole_cards: Tuple[Card, Card], board: List[Card]) ->
         category = "two_pair"  # Changed from "strong" for clarity
     elif score == 2:  # One pair
         # Classify pair strength relative to board
-        pair_strength = classify_pair_strength(hole_cards, board)
-
-        if pair_strength == 'overpair':
-            category = "overpair"
-        elif pair_strength == 'top_pair':
-            category = "top_pair"
-        elif pair_strength == 'second_pair':
-            category = "second_pair"
-        elif pair_strength == 'third_pair':
-            category = "third_pair"
-        else:
-            category = "underpair"
-
-        metadata['pair_strength'] = pair_strength
+        pair_strength = _classify_pair(rank1, rank2, board_mask)
+        category = CATEGORY_BY_PAIR[pair_strength]
+        metadata['pair_strength'] = _PAIR_STRENGTH_LABELS[pair_strength]
     else:  # High card
         category = "high_card"
 
@@ -255,62 +358,122 @@ def classify_pair_strength(hole_cards: Tuple[Card, Card], board: List[Card]) ->
     if not board:
         return 'no_pair'
 
-    # Get all unique board card ranks sorted high to low
-    board_ranks = sorted(set([c.get_rank_value() for c in board]), reverse=True)
+    _, _, (rank1, rank2), board_mask = _extract_features(hole_cards, board)
+    return _PAIR_STRENGTH_LABELS[_classify_pair(rank1, rank2, board_mask)]
 
-    card1, card2 = hole_cards
 
-    # Check if we have a pocket pair
-    if card1.get_rank_value() == card2.get_rank_value():
-        pair_rank = card1.get_rank_value()
+# Pocket pair classification memo: pair_rank << 15 | board_mask ->
+# classify_pair_strength result. A pocket pair's class depends on nothing
+# else, so each combination is worked out once, on first use (at most 13
+# ranks x 2379 boards of 1-5 distinct ranks).
+_POCKET_PAIR_CLASSES: Dict[int, PairStrength] = {}
+
+
+def _top_board_ranks(board_mask: int) -> Tuple[int, int, int]:
+    """
+    The three highest distinct ranks in a non-empty board rank mask (bit r
+    for rank r), highest first, -1 where the board has fewer.
+    """
+    top_rank = board_mask.bit_length() - 1
+    lower_mask = board_mask ^ (1 << top_rank)
+    second_rank = lower_mask.bit_length() - 1
+    third_rank = (lower_mask ^ (1 << second_rank)).bit_length() - 1 if lower_mask else -1
+    return (top_rank, second_rank, third_rank)
+
+
+def _classify_pocket_pair(pair_rank: int, board_mask: int) -> PairStrength:
+    """Uncached pocket pair branch of _classify_pair."""
+    top_rank, second_rank, third_rank = _top_board_ranks(board_mask)
 
-        # Overpair: pocket pair higher than all board cards
-        if pair_rank > board_ranks[0]:
-            return 'overpair'
+    # Overpair: pocket pair higher than all board cards
+    if pair_rank > top_rank:
+        return PairStrength.OVERPAIR
 
-        # Check if pocket pair ranks between board cards (e.g., KK on A-7-2 or Q-7-2)
-        if len(board_ranks) > 1 and board_ranks[0] > pair_rank > board_ranks[1]:
-            return 'second_pair'
+    # Check if pocket pair ranks between board cards (e.g., KK on A-7-2 or Q-7-2)
+    if second_rank >= 0 and top_rank > pair_rank > second_rank:
+        return PairStrength.SECOND_PAIR
 
-        if len(board_ranks) > 2 and board_ranks[1] > pair_rank > board_ranks[2]:
-            return 'third_pair'
+    if third_rank >= 0 and second_rank > pair_rank > third_rank:
+        return PairStrength.THIRD_PAIR
 
-        # Underpair: pocket pair lower than all board cards
-        return 'underpair'
+    # Underpair: pocket pair lower than all board cards
+    return PairStrength.UNDERPAIR
+
+
+def _classify_pair(rank1: int, rank2: int, board_mask: int) -> PairStrength:
+    """
+    classify_pair_strength on plain ranks (2-14): the two hole ranks, and the
+    board's ranks as a bitmask with bit r set for each rank r on it (at least
+    one). Returns a PairStrength rather than its label.
+    """
+    # Check if we have a pocket pair
+    if rank1 == rank2:
+        key = (rank1 << 15) | board_mask
+        pair_class = _POCKET_PAIR_CLASSES.get(key)
+        if pair_class is None:
+            pair_class = _POCKET_PAIR_CLASSES[key] = _classify_pocket_pair(rank1, board_mask)
+        return pair_class
+
+    # Only the top three distinct board ranks are compared against; the full
+    # mask answers the "paired some lower card" check
+    top_rank, second_rank, third_rank = _top_board_ranks(board_mask)
 
     # Not a pocket pair, check if we paired a board card
-    for hole_card in hole_cards:
-        hole_rank = hole_card.get_rank_value()
+    for hole_rank in (rank1, rank2):
+        if hole_rank == top_rank:
+            return PairStrength.TOP_PAIR
+        elif hole_rank == second_rank:
+            return PairStrength.SECOND_PAIR
+        elif hole_rank == third_rank:
+            return PairStrength.THIRD_PAIR
+        elif board_mask >> hole_rank & 1:
+            return PairStrength.UNDERPAIR
+
+    return PairStrength.NO_PAIR
 
-        if hole_rank == board_ranks[0]:
-            return 'top_pair'
-        elif len(board_ranks) > 1 and hole_rank == board_ranks[1]:
-            return 'second_pair'
-        elif len(board_ranks) > 2 and hole_rank == board_ranks[2]:
-            return 'third_pair'
-        elif hole_rank in board_ranks:
-            return 'underpair'
 
-    return 'no_pair'
+# Set once is_top_pair has issued its DeprecationWarning
+_is_top_pair_warned = False
 
 
 def is_top_pair(hole_cards: Tuple[Card, Card], board: List[Card], tiebreakers: List[int]) -> bool:
     """
     Check if we have top pair (pair with highest board card).
     DEPRECATED: Use classify_pair_strength instead for more detailed classification.
+    Warns on the first call only.
     """
+    global _is_top_pair_warned
+    if not _is_top_pair_warned:
+        _is_top_pair_warned = True
+        warnings.warn("is_top_pair is deprecated; use classify_pair_strength instead",
+                      DeprecationWarning, stacklevel=2)
+
     if not board:
         return False
 
     # Get highest board card
-    highest_board_rank = max(c.get_rank_value() for c in board)
+    highest_board_rank = max(card.index % 13 for card in board)
 
     # Check if one of our hole cards matches
-    for hole_card in hole_cards:
-        if hole_card.get_rank_value() == highest_board_rank:
-            return True
+    card1, card2 = hole_cards
+    return card1.index % 13 == highest_board_rank or card2.index % 13 == highest_board_rank
+
 
-    return False
+# Five-rank windows holding four ranks with the missing one inside
+_GUTSHOT_WINDOWS = frozenset((0b10111, 0b11011, 0b11101))
+
+# Straight draws held in a window of five consecutive ranks (bit 0 = lowest):
+# bit 0 set for an open-ender (the window's lowest four ranks), bit 1 for a
+# gutshot
+_WINDOW_DRAWS = bytes(
+    (window & 0b1111 == 0b1111) | (window in _GUTSHOT_WINDOWS) << 1
+    for window in range(32)
+)
+
+# Wheel draws with the ace played low, as a 5-bit window over A-2-3-4-5
+# (bit 0 = ace). A-2-3-4 can only be filled by a five, so it counts as a
+# gutshot; 2-3-4-5 is an ordinary open-ender.
+_WHEEL_GUTSHOTS = _GUTSHOT_WINDOWS | {0b01111}
 
 
 def check_for_draws(hole_cards: Tuple[Card, Card], board: List[Card]) -> dict:
@@ -329,32 +492,73 @@ def check_for_draws(hole_cards: Tuple[Card, Card], board: List[Card]) -> dict:
     if len(board) < 3:
         return draws
 
-    all_cards = list(hole_cards) + board
+    rank_mask, suit_masks, _, _ = _extract_features(hole_cards, board)
+    flush_draw, oesd, gutshot = _draw_flags(rank_mask, suit_masks)
+    draws['flush_draw'] = flush_draw
+    draws['oesd'] = oesd
+    draws['gutshot'] = gutshot
+    return draws
+
 
-    # Check for flush draw (4 to a flush)
-    suit_counts = {}
-    for card in all_cards:
-        suit_counts[card.suit] = suit_counts.get(card.suit, 0) + 1
+def _extract_features(hole_cards: Tuple[Card, Card],
+                      board: List[Card]) -> Tuple[int, List[int], Tuple[int, int], int]:
+    """
+    Everything the postflop helpers read off the cards, in a single pass.
 
-    if max(suit_counts.values()) == 4:
-        draws['flush_draw'] = True
+    Returns:
+        Tuple of (rank_mask, suit_masks, hole_ranks, board_mask)
+        - rank_mask: one bit per rank (deuce = bit 0) for all the cards
+        - suit_masks: the same per suit, indexed as Card.index // 13
+        - hole_ranks: the two hole card ranks (2-14)
+        - board_mask: the board's ranks, bit r set for each rank r on it
+    """
+    board_rank_mask = 0
+    suit_masks = [0, 0, 0, 0]
+    for card in board:
+        index = card.index
+        rank_bit = 1 << (index % 13)
+        board_rank_mask |= rank_bit
+        suit_masks[index // 13] |= rank_bit
+
+    card1, card2 = hole_cards
+    index1 = card1.index
+    index2 = card2.index
+    rank1 = index1 % 13
+    rank2 = index2 % 13
+    suit_masks[index1 // 13] |= 1 << rank1
+    suit_masks[index2 // 13] |= 1 << rank2
+    rank_mask = board_rank_mask | (1 << rank1) | (1 << rank2)
+    return (rank_mask, suit_masks, (rank1 + 2, rank2 + 2), board_rank_mask << 2)
 
-    # Check for straight draws
-    ranks = sorted(set(c.get_rank_value() for c in all_cards))
 
-    # Check for open-ended straight draw (4 consecutive cards)
-    for i in range(len(ranks) - 3):
-        if ranks[i+3] - ranks[i] == 3:
-            draws['oesd'] = True
+def _draw_flags(rank_mask: int, suit_masks: List[int]) -> Tuple[bool, bool, bool]:
+    """
+    check_for_draws on rank bitmasks (deuce = bit 0): the mask of all ranks
+    held and one mask per suit.
+
+    Returns:
+        Tuple of (flush_draw, oesd, gutshot)
+    """
+    # Check for flush draw (exactly 4 to a flush)
+    flush_draw = False
+    for suit_mask in suit_masks:
+        if RANK_MASK_BITS[suit_mask] == 4:
+            flush_draw = True
             break
 
-    # Check for gutshot (4 cards with one gap)
-    for i in range(len(ranks) - 3):
-        if ranks[i+3] - ranks[i] == 4:
-            draws['gutshot'] = True
+    # Check for straight draws, open-ended (4 consecutive ranks) and gutshot
+    # (4 of 5 consecutive ranks, the gap inside), one window per lowest rank
+    draws = 0
+    for shift in range(10):
+        draws |= _WINDOW_DRAWS[(rank_mask >> shift) & 0x1F]
+        if draws == 3:
             break
+    oesd = bool(draws & 1)
 
-    return draws
+    # An ace also plays low, below the deuce
+    gutshot = bool(draws & 2) or (((rank_mask << 1) | (rank_mask >> 12)) & 0x1F) in _WHEEL_GUTSHOTS
+
+    return (flush_draw, oesd, gutshot)
 
 
 if __name__ == "__main__":
@@ -382,12 +586,7 @@ if __name__ == "__main__":
     for card1_str, card2_str, description in test_hands:
         hand = create_hand(card1_str, card2_str)
         strength = calculate_preflop_strength(hand)
-        category = (
-            "Premium" if is_premium_hand(strength)
-            else "Strong" if is_strong_hand(strength)
-            else "Medium" if is_medium_hand(strength)
-            else "Weak"
-        )
+        category = STRENGTH_NAMES[classify_strength(strength)]
         print(f"  {description}: {strength:.2f} ({category})")
 
     print()
@@ -0,0 +1,667 @@
+"""
+Unit tests for hand_eval.rank_hand.
+
+Run from backend-python/engine:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+# The engine modules import each other as top-level modules (e.g. `from card import Card`)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card import Card
+from hand_eval import (pack_card_indices, rank_hand, rank_hand_indices, rank_hands_batch,
+                       rank_hands_batch_packed, rank_hands_parallel, rank_packed_hands)
+
+
+class TestHandRanking(unittest.TestCase):
+    """Unit tests for hand ranking function."""
+    
+    def test_royal_flush(self):
+        """Test royal flush detection."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'),
+            Card.from_string('Js'), Card.from_string('10s')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 10)
+        self.assertEqual(tiebreakers, [14, 13, 12, 11, 10])
+    
+    def test_straight_flush(self):
+        """Test straight flush detection."""
+        # Regular straight flush
+        cards = [
+            Card.from_string('9s'), Card.from_string('8s'), Card.from_string('7s'),
+            Card.from_string('6s'), Card.from_string('5s')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 9)
+        self.assertEqual(tiebreakers, [9])
+        
+        # Ace-low straight flush (wheel)
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
+            Card.from_string('4h'), Card.from_string('5h')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 9)
+        self.assertEqual(tiebreakers, [5])
+    
+    def test_quads(self):
+        """Test quads (four of a kind) detection."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
+            Card.from_string('Ac'), Card.from_string('Ks')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 8)
+        self.assertEqual(tiebreakers, [14, 13])
+    
+    def test_boat(self):
+        """Test boat (full house) detection."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
+            Card.from_string('Ks'), Card.from_string('Kh')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 7)
+        self.assertEqual(tiebreakers, [14, 13])
+    
+    def test_flush(self):
+        """Test flush detection."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'),
+            Card.from_string('9s'), Card.from_string('2s')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 6)
+        self.assertEqual(tiebreakers, [14, 13, 12, 9, 2])
+    
+    def test_straight(self):
+        """Test straight detection."""
+        # Regular straight
+        cards = [
+            Card.from_string('9s'), Card.from_string('8h'), Card.from_string('7d'),
+            Card.from_string('6c'), Card.from_string('5s')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 5)
+        self.assertEqual(tiebreakers, [9])
+        
+        # Ace-low straight (wheel)
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('5h')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 5)
+        self.assertEqual(tiebreakers, [5])
+        
+        # High straight (10-J-Q-K-A)
+        cards = [
+            Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qd'),
+            Card.from_string('Jc'), Card.from_string('10s')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 5)
+        self.assertEqual(tiebreakers, [14])
+    
+    def test_trips(self):
+        """Test trips (three of a kind) detection."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
+            Card.from_string('Ks'), Card.from_string('Qs')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 4)
+        self.assertEqual(tiebreakers, [14, 13, 12])
+    
+    def test_two_pair(self):
+        """Test two pair detection."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ks'),
+            Card.from_string('Kh'), Card.from_string('Qs')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 3)
+        self.assertEqual(tiebreakers, [14, 13, 12])
+    
+    def test_one_pair(self):
+        """Test one pair detection."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ks'),
+            Card.from_string('Qh'), Card.from_string('Js')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 2)
+        self.assertEqual(tiebreakers, [14, 13, 12, 11])
+    
+    def test_high_card(self):
+        """Test high card detection."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'),
+            Card.from_string('9h'), Card.from_string('2d')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 1)
+        self.assertEqual(tiebreakers, [14, 13, 12, 9, 2])
+    
+    def test_seven_card_hand(self):
+        """Test that function works with 7 cards (Texas Hold'em)."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'),
+            Card.from_string('Js'), Card.from_string('10s'),  # Royal flush
+            Card.from_string('9h'), Card.from_string('8h')    # Extra cards
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 10)
+        self.assertEqual(tiebreakers, [14, 13, 12, 11, 10])
+    
+    def test_edge_case_wheel_straight_flush(self):
+        """Test ace-low straight flush (wheel) edge case."""
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
+            Card.from_string('4h'), Card.from_string('5h')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 9)
+        self.assertEqual(tiebreakers, [5])
+    
+    def test_edge_case_wheel_straight(self):
+        """Test ace-low straight (wheel) edge case."""
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('5h')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 5)
+        self.assertEqual(tiebreakers, [5])
+    
+    def test_edge_case_not_straight_with_ace(self):
+        """Test that A-K-Q-J-9 is not a straight."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qd'),
+            Card.from_string('Jc'), Card.from_string('9s')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertNotEqual(score, 5)  # Should not be a straight
+    
+    def test_edge_case_boat_vs_trips(self):
+        """Test that boat is correctly identified vs trips."""
+        # Boat
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
+            Card.from_string('Ks'), Card.from_string('Kh')
+        ]
+        score, _, _ = rank_hand(cards)
+        self.assertEqual(score, 7)
+        
+        # Trips (not boat)
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
+            Card.from_string('Ks'), Card.from_string('Qs')
+        ]
+        score, _, _ = rank_hand(cards)
+        self.assertEqual(score, 4)
+    
+    def test_edge_case_flush_vs_straight_flush(self):
+        """Test that straight flush is correctly identified vs flush."""
+        # Straight flush
+        cards = [
+            Card.from_string('9s'), Card.from_string('8s'), Card.from_string('7s'),
+            Card.from_string('6s'), Card.from_string('5s')
+        ]
+        score, _, _ = rank_hand(cards)
+        self.assertEqual(score, 9)
+        
+        # Flush (not straight)
+        cards = [
+            Card.from_string('As'), Card.from_string('Ks'), Card.from_string('Qs'),
+            Card.from_string('9s'), Card.from_string('2s')
+        ]
+        score, _, _ = rank_hand(cards)
+        self.assertEqual(score, 6)
+    
+    def test_empty_hand_error(self):
+        """Test that empty hand raises error."""
+        with self.assertRaises(ValueError):
+            rank_hand([])
+    
+    def test_insufficient_cards_error(self):
+        """Test that less than 5 cards raises error."""
+        cards = [Card.from_string('As'), Card.from_string('Ks')]
+        with self.assertRaises(ValueError):
+            rank_hand(cards)
+    
+    def test_tiebreaker_ordering(self):
+        """Test that tiebreakers are correctly ordered."""
+        # Two pair: A-A-K-K-Q should have tiebreakers [14, 13, 12]
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ks'),
+            Card.from_string('Kh'), Card.from_string('Qs')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 3)
+        self.assertEqual(tiebreakers, [14, 13, 12])
+        
+        # Two pair: K-K-Q-Q-A should have tiebreakers [13, 12, 14]
+        cards = [
+            Card.from_string('Ks'), Card.from_string('Kh'), Card.from_string('Qs'),
+            Card.from_string('Qh'), Card.from_string('As')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 3)
+        self.assertEqual(tiebreakers, [13, 12, 14])
+    
+    def test_duplicate_cards_error(self):
+        """Test that duplicate cards raise an error."""
+        # Duplicate in hand
+        cards = [
+            Card.from_string('As'), Card.from_string('As'), Card.from_string('Ks'),
+            Card.from_string('Qs'), Card.from_string('Js')
+        ]
+        with self.assertRaises(ValueError) as context:
+            rank_hand(cards)
+        self.assertIn("Duplicate cards", str(context.exception))
+        
+        # Duplicate in 7-card hand
+        cards = [
+            Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qs'),
+            Card.from_string('Js'), Card.from_string('10s'), Card.from_string('9h'),
+            Card.from_string('As')  # Duplicate As
+        ]
+        with self.assertRaises(ValueError) as context:
+            rank_hand(cards)
+        self.assertIn("Duplicate cards", str(context.exception))
+    
+    def test_set_vs_trips(self):
+        """Test that set vs trips can be differentiated."""
+        # Set: Pocket pair (As, Ah) + board card (Ad) + 2 other board cards
+        hole_cards = [Card.from_string('As'), Card.from_string('Ah')]
+        board = [Card.from_string('Ad'), Card.from_string('Ks'), Card.from_string('Qs')]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 4)
+        self.assertEqual(metadata.get('trips_type'), 'set')
+        
+        # Trips: Board pair (As, Ah) + hole card (Ad) + 2 other cards
+        hole_cards = [Card.from_string('Ad'), Card.from_string('Ks')]
+        board = [Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Qs')]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 4)
+        self.assertEqual(metadata.get('trips_type'), 'trips')
+        
+        # Test without hole_cards parameter (should not have trips_type)
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
+            Card.from_string('Ks'), Card.from_string('Qs')
+        ]
+        score, tiebreakers, metadata = rank_hand(cards)
+        self.assertEqual(score, 4)
+        self.assertNotIn('trips_type', metadata)
+    
+    def test_board_chop_straight(self):
+        """Test board chop with straight on board."""
+        # Pocket Kings on board with straight 2-3-4-5-6
+        hole_cards = [Card.from_string('Ks'), Card.from_string('Kh')]
+        board = [
+            Card.from_string('2s'), Card.from_string('3h'), Card.from_string('4d'),
+            Card.from_string('5c'), Card.from_string('6s')
+        ]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 5)  # Straight
+        self.assertTrue(metadata.get('board_chop', False))
+        self.assertFalse(metadata.get('hole_cards_play', True))
+    
+    def test_board_chop_straight_flush(self):
+        """Test board chop with straight flush on board."""
+        # Any hole cards on board with straight flush
+        hole_cards = [Card.from_string('Ks'), Card.from_string('Kh')]
+        board = [
+            Card.from_string('2s'), Card.from_string('3s'), Card.from_string('4s'),
+            Card.from_string('5s'), Card.from_string('6s')
+        ]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 9)  # Straight Flush
+        self.assertTrue(metadata.get('board_chop', False))
+        self.assertFalse(metadata.get('hole_cards_play', True))
+    
+    def test_board_chop_flush(self):
+        """Test board chop with flush on board."""
+        hole_cards = [Card.from_string('Kh'), Card.from_string('Kd')]
+        board = [
+            Card.from_string('2s'), Card.from_string('4s'), Card.from_string('6s'),
+            Card.from_string('8s'), Card.from_string('10s')  # Flush, not a straight
+        ]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 6)  # Flush
+        self.assertTrue(metadata.get('board_chop', False))
+        self.assertFalse(metadata.get('hole_cards_play', True))
+    
+    def test_no_board_chop_when_hole_cards_play(self):
+        """Test that board chop is False when hole cards are used."""
+        # Pocket Aces with board that doesn't make best hand (no straight/flush)
+        hole_cards = [Card.from_string('As'), Card.from_string('Ah')]
+        board = [
+            Card.from_string('2h'), Card.from_string('3d'), Card.from_string('4c'),
+            Card.from_string('6s'), Card.from_string('8h')  # No straight possible, mixed suits
+        ]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 2)  # One Pair (Aces)
+        self.assertFalse(metadata.get('board_chop', True))
+        self.assertTrue(metadata.get('hole_cards_play', False))
+    
+    def test_board_chop_when_hole_card_only_duplicates_board_rank(self):
+        """Test board chop when a hole card matches a board card's rank but adds nothing."""
+        hole_cards = [Card.from_string('10h'), Card.from_string('2c')]
+        board = [
+            Card.from_string('Ah'), Card.from_string('Ks'), Card.from_string('Qd'),
+            Card.from_string('Jc'), Card.from_string('10s')
+        ]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 5)  # Broadway straight, already on the board
+        self.assertTrue(metadata.get('board_chop', False))
+        self.assertFalse(metadata.get('hole_cards_play', True))
+    
+    def test_board_chop_with_quads_on_board(self):
+        """Test board chop with quads on board where board kicker is highest."""
+        # Board has quads with high kicker, hole cards are lower
+        hole_cards = [Card.from_string('2s'), Card.from_string('3h')]
+        board = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
+            Card.from_string('Ac'), Card.from_string('Ks')  # K is higher than hole cards
+        ]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 8)  # Quads
+        self.assertTrue(metadata.get('board_chop', False))
+        self.assertFalse(metadata.get('hole_cards_play', True))
+    
+    def test_edge_case_wheel_straight_high_card(self):
+        """Test that wheel (A-2-3-4-5) returns 5 as high card, not Ace."""
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('5h')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 5)  # Straight
+        self.assertEqual(tiebreakers, [5])  # High card is 5, not 14 (Ace)
+    
+    def test_edge_case_wheel_straight_flush_high_card(self):
+        """Test that wheel straight flush returns 5 as high card."""
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
+            Card.from_string('4h'), Card.from_string('5h')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 9)  # Straight Flush
+        self.assertEqual(tiebreakers, [5])  # High card is 5
+    
+    def test_edge_case_wheel_vs_high_straight(self):
+        """Test that high straight (10-J-Q-K-A) beats wheel."""
+        wheel = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('5h')
+        ]
+        high_straight = [
+            Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qd'),
+            Card.from_string('Jc'), Card.from_string('10s')
+        ]
+        
+        wheel_score, wheel_tie, _ = rank_hand(wheel)
+        high_score, high_tie, _ = rank_hand(high_straight)
+        
+        self.assertEqual(wheel_score, 5)
+        self.assertEqual(high_score, 5)
+        self.assertEqual(wheel_tie, [5])
+        self.assertEqual(high_tie, [14])  # High straight wins with Ace high
+        # High straight should beat wheel
+        self.assertGreater(high_tie[0], wheel_tie[0])
+    
+    def test_edge_case_wheel_board_chop(self):
+        """Test board chop with wheel on board."""
+        hole_cards = [Card.from_string('Ks'), Card.from_string('Kh')]
+        board = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('5h')
+        ]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 5)  # Straight (wheel)
+        self.assertEqual(tiebreakers, [5])  # High card is 5
+        self.assertTrue(metadata.get('board_chop', False))
+        self.assertFalse(metadata.get('hole_cards_play', True))
+    
+    def test_edge_case_wheel_straight_flush_board_chop(self):
+        """Test board chop with wheel straight flush on board."""
+        hole_cards = [Card.from_string('Ks'), Card.from_string('Kh')]
+        board = [
+            Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
+            Card.from_string('4h'), Card.from_string('5h')
+        ]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 9)  # Straight Flush (wheel)
+        self.assertEqual(tiebreakers, [5])
+        self.assertTrue(metadata.get('board_chop', False))
+    
+    def test_edge_case_not_straight_ace_high(self):
+        """Test that A-K-Q-J-9 is not a straight (missing 10)."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qd'),
+            Card.from_string('Jc'), Card.from_string('9s')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertNotEqual(score, 5)  # Should not be a straight
+        self.assertEqual(score, 1)  # Should be high card
+    
+    def test_edge_case_not_straight_ace_low(self):
+        """Test that A-2-3-4-6 is not a straight (missing 5)."""
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('6h')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertNotEqual(score, 5)  # Should not be a straight
+        self.assertEqual(score, 1)  # Should be high card
+    
+    def test_edge_case_not_straight_middle_gap(self):
+        """Test that 2-3-4-6-7 is not a straight (missing 5)."""
+        cards = [
+            Card.from_string('2s'), Card.from_string('3h'), Card.from_string('4d'),
+            Card.from_string('6c'), Card.from_string('7s')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertNotEqual(score, 5)  # Should not be a straight
+        self.assertEqual(score, 1)  # Should be high card
+    
+    def test_edge_case_quads_with_wheel_kicker(self):
+        """Test quads with wheel kicker (edge case for tiebreakers)."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
+            Card.from_string('Ac'), Card.from_string('5h')  # Wheel high card as kicker
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 8)  # Quads
+        self.assertEqual(tiebreakers, [14, 5])  # Quads rank, kicker
+    
+    def test_edge_case_boat_with_wheel_trips(self):
+        """Test full house where trips are wheel (A-A-A-2-2)."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'), Card.from_string('Ad'),
+            Card.from_string('2s'), Card.from_string('2h')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 7)  # Boat
+        self.assertEqual(tiebreakers, [14, 2])  # Trips rank, pair rank
+    
+    def test_edge_case_boat_with_wheel_pair(self):
+        """Test full house where pair is wheel (A-A-2-2-2)."""
+        cards = [
+            Card.from_string('As'), Card.from_string('Ah'),
+            Card.from_string('2s'), Card.from_string('2h'), Card.from_string('2d')
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 7)  # Boat
+        self.assertEqual(tiebreakers, [2, 14])  # Trips rank (2), pair rank (A)
+    
+    def test_edge_case_wheel_in_seven_cards(self):
+        """Test that wheel is correctly identified in 7-card hand."""
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('5h'),  # Wheel
+            Card.from_string('Ks'), Card.from_string('Qh')  # Extra cards
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 5)  # Straight (wheel)
+        self.assertEqual(tiebreakers, [5])
+    
+    def test_edge_case_wheel_straight_flush_in_seven_cards(self):
+        """Test that wheel straight flush is correctly identified in 7-card hand."""
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2h'), Card.from_string('3h'),
+            Card.from_string('4h'), Card.from_string('5h'),  # Wheel straight flush
+            Card.from_string('Ks'), Card.from_string('Qh')  # Extra cards
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertEqual(score, 9)  # Straight Flush (wheel)
+        self.assertEqual(tiebreakers, [5])
+    
+    def test_edge_case_high_straight_vs_wheel_in_seven_cards(self):
+        """Test that high straight beats wheel when both possible in 7 cards."""
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('5h'),  # Wheel possible
+            Card.from_string('Kh'), Card.from_string('Qh')   # High straight possible
+        ]
+        # Should choose high straight (10-J-Q-K-A) over wheel
+        score, tiebreakers, _ = rank_hand(cards)
+        # Actually, with these cards, we can't make high straight (need 10, J)
+        # So it should be wheel
+        self.assertEqual(score, 5)  # Straight
+        # But let's test with actual high straight possible
+        cards2 = [
+            Card.from_string('As'), Card.from_string('Kh'), Card.from_string('Qd'),
+            Card.from_string('Jc'), Card.from_string('10s'),  # High straight
+            Card.from_string('2h'), Card.from_string('3h')    # Extra cards
+        ]
+        score2, tiebreakers2, _ = rank_hand(cards2)
+        self.assertEqual(score2, 5)
+        self.assertEqual(tiebreakers2, [14])  # High straight
+    
+    def test_edge_case_wheel_with_pocket_pair(self):
+        """Test wheel with pocket pair (should still be wheel, not pair)."""
+        hole_cards = [Card.from_string('Ks'), Card.from_string('Kh')]
+        board = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('5h')
+        ]
+        all_cards = hole_cards + board
+        
+        score, tiebreakers, metadata = rank_hand(all_cards, hole_cards=hole_cards)
+        self.assertEqual(score, 5)  # Straight (wheel), not pair
+        self.assertEqual(tiebreakers, [5])
+        self.assertTrue(metadata.get('board_chop', False))
+    
+    def test_edge_case_almost_wheel_missing_one(self):
+        """Test A-2-3-4-X where X is not 5 (not a wheel)."""
+        cards = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('6h')  # Missing 5
+        ]
+        score, tiebreakers, _ = rank_hand(cards)
+        self.assertNotEqual(score, 5)  # Should not be a straight
+        self.assertEqual(score, 1)  # High card
+    
+    def test_edge_case_wheel_vs_regular_straight_comparison(self):
+        """Test that regular straight (6-7-8-9-10) beats wheel."""
+        wheel = [
+            Card.from_string('Ah'), Card.from_string('2s'), Card.from_string('3d'),
+            Card.from_string('4c'), Card.from_string('5h')
+        ]
+        regular = [
+            Card.from_string('6s'), Card.from_string('7h'), Card.from_string('8d'),
+            Card.from_string('9c'), Card.from_string('10s')
+        ]
+        
+        wheel_score, wheel_tie, _ = rank_hand(wheel)
+        regular_score, regular_tie, _ = rank_hand(regular)
+        
+        self.assertEqual(wheel_score, 5)
+        self.assertEqual(regular_score, 5)
+        self.assertEqual(wheel_tie, [5])
+        self.assertEqual(regular_tie, [10])
+        # Regular straight should beat wheel
+        self.assertGreater(regular_tie[0], wheel_tie[0])
+    
+    def test_rank_hand_indices_matches_rank_hand(self):
+        """Test that ranking deck indices gives the same result as ranking Cards."""
+        cards = [
+            Card.from_string('Ah'), Card.from_string('As'), Card.from_string('Kd'),
+            Card.from_string('Kc'), Card.from_string('Ad'), Card.from_string('7s'),
+            Card.from_string('2h')
+        ]
+        hole_cards = [cards[0], cards[1]]
+        
+        result = rank_hand_indices(bytes(c.index for c in cards),
+                                   bytes(c.index for c in hole_cards))
+        
+        self.assertEqual(result, rank_hand(cards, hole_cards=hole_cards))
+        self.assertEqual(result[0], 7)  # Aces full of kings
+        self.assertEqual(rank_hand_indices(bytearray(c.index for c in cards)), rank_hand(cards))
+    
+    def test_rank_hand_indices_rejects_bad_index(self):
+        """Test that indices outside 0-51 are rejected."""
+        with self.assertRaises(ValueError):
+            rank_hand_indices(bytes([0, 1, 2, 3, 52]))
+    
+    def test_rank_hands_parallel_matches_batch(self):
+        """Test that ranking in worker processes keeps results and their order."""
+        deck = [Card.from_index(i).ck32 for i in range(52)]
+        hands = [deck[i:i + 7] for i in range(0, 45, 3)] + [deck[i:i + 5] for i in range(0, 47, 4)]
+        
+        self.assertEqual(rank_hands_parallel(hands, workers=2, chunk_size=4), rank_hands_batch(hands))
+    
+    def test_rank_hands_batch_packed_orders_like_tuples(self):
+        """Test that packed scores hold the score and order like (score, tiebreakers)."""
+        deck = [Card.from_index(i).ck32 for i in range(52)]
+        hands = ([deck[i:i + 7] for i in range(0, 45, 3)]
+                 + [deck[i::13] + [deck[(i + 5) % 13]] for i in range(13)])  # quads
+        scores, tiebreakers = rank_hands_batch(hands)
+        packed = rank_hands_batch_packed(hands)
+        
+        self.assertEqual([p >> 20 for p in packed], scores)
+        by_tuple = sorted(range(len(hands)), key=lambda i: (scores[i], tiebreakers[i]))
+        self.assertEqual(sorted(range(len(hands)), key=lambda i: packed[i]), by_tuple)
+    
+    def test_rank_packed_hands_matches_batch_packed(self):
+        """Test that hands packed as 6-bit deck indices rank like card code hands."""
+        hands = ([list(range(i, i + 7)) for i in range(0, 45, 3)]
+                 + [[i, i + 13, i + 26, i + 39, 0, 1, 2] for i in range(3, 13)])  # quads
+        codes = [[Card.from_index(i).ck32 for i in hand] for hand in hands]
+        
+        self.assertEqual(rank_packed_hands(pack_card_indices(hand) for hand in hands),
+                         rank_hands_batch_packed(codes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for simulation.SimulationGame betting rounds.
+
+Run from backend-python/engine:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+# The engine modules import each other as top-level modules (e.g. `from card import Card`)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation import SimulationGame
+
+
+class ScriptedBrain:
+    """Brain stand-in that answers every decision with one fixed action."""
+
+    def __init__(self, preflop, postflop=("check", 0.0)):
+        self.preflop = preflop
+        self.postflop = postflop
+
+    def make_preflop_decision(self, **kwargs):
+        return self.preflop
+
+    def make_postflop_decision(self, **kwargs):
+        return self.postflop
+
+
+class TestBettingRound(unittest.TestCase):
+    """Unit tests for SimulationGame.betting_round."""
+
+    def _start_hand(self, button_stack, button_brain, bb_brain):
+        """Seat a button and a big blind, post blinds and deal; blinds are $5/$10."""
+        game = SimulationGame(small_blind=5.0, big_blind=10.0, seed=1)
+        game.add_player("Button", button_stack, 1, button_brain)
+        game.add_player("BB", 1000.0, 0, bb_brain)
+        game.reset_for_new_hand()
+        game.post_blinds()
+        game.deal_hole_cards()
+        return game
+
+    def test_short_all_in_below_big_blind_gets_one_check(self):
+        """Test that a shove for less than the big blind ends after a single check."""
+        game = self._start_hand(8.0, ScriptedBrain(("raise", 30.0)), ScriptedBrain(("check", 0.0)))
+
+        self.assertTrue(game.betting_round("preflop"))
+        self.assertEqual(game.action_history[2:], ["Button raises to $8.00 (all-in)", "BB checks"])
+
+    def test_zero_raises_still_end_the_round(self):
+        """Test that raises sized below a big blind are bumped up, so raise wars run out of chips."""
+        raiser = ScriptedBrain(("call", 0.0), postflop=("raise", 0.0))
+        game = self._start_hand(100.0, raiser, raiser)
+        self.assertTrue(game.betting_round("preflop"))
+
+        game.deal_flop()
+        self.assertTrue(game.betting_round("flop"))
+        # Blinds, two preflop calls and the flop come first
+        self.assertEqual(game.action_history[5:7], ["BB raises to $10.00", "Button raises to $20.00"])
+        self.assertTrue(game.players[0].is_all_in)
+
+    def test_unknown_action_raises(self):
+        """Test that an action other than fold, check, call or raise is an error, not a hang."""
+        better = ScriptedBrain(("call", 0.0), postflop=("bet", 1.0))
+        game = self._start_hand(100.0, better, better)
+        self.assertTrue(game.betting_round("preflop"))
+
+        game.deal_flop()
+        with self.assertRaises(ValueError):
+            game.betting_round("flop")
+
+
+if __name__ == "__main__":
+    unittest.main()
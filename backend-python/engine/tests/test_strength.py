@@ -0,0 +1,56 @@
+"""
+Unit tests for strength.check_for_draws.
+
+Run from backend-python/engine:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+# The engine modules import each other as top-level modules (e.g. `from card import Card`)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card import Card, create_hand
+from strength import check_for_draws
+
+
+def _draws(hole, board):
+    """check_for_draws on cards given as strings, e.g. _draws("Ah 2c", "3d 4s 9h")."""
+    return check_for_draws(create_hand(*hole.split()), [Card.from_string(c) for c in board.split()])
+
+
+class TestCheckForDraws(unittest.TestCase):
+    """Unit tests for flush and straight draw detection."""
+
+    def test_wheel_draws_are_gutshots(self):
+        """Test that four of A-2-3-4-5, ace played low, count as a gutshot."""
+        for hole, board in (("Ah 2c", "3d 4s 9h"),   # A-2-3-4, needs a five
+                            ("Ah 2c", "3d 5s 9h"),   # A-2-3-5
+                            ("Ah 2c", "4d 5s 9h"),   # A-2-4-5
+                            ("Ah 3c", "4d 5s 9h")):  # A-3-4-5
+            with self.subTest(hole=hole, board=board):
+                draws = _draws(hole, board)
+                self.assertTrue(draws['gutshot'])
+                self.assertFalse(draws['oesd'])
+
+    def test_open_ended_draw(self):
+        """Test that four consecutive ranks are an open-ended draw, not a gutshot."""
+        draws = _draws("8h 9c", "10d Js 2h")
+        self.assertTrue(draws['oesd'])
+        self.assertFalse(draws['gutshot'])
+
+        # 2-3-4-5 with no ace is still an ordinary open-ender
+        draws = _draws("2h 3c", "4d 5s Kh")
+        self.assertTrue(draws['oesd'])
+        self.assertFalse(draws['gutshot'])
+
+    def test_made_flush_is_not_a_flush_draw(self):
+        """Test that five cards of a suit are not a flush draw, but four are."""
+        self.assertFalse(_draws("Ah 9h", "2h 5h Kh")['flush_draw'])
+        self.assertTrue(_draws("Ah 9h", "2h 5h Kc")['flush_draw'])
+
+
+if __name__ == "__main__":
+    unittest.main()